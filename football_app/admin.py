@@ -1,25 +1,162 @@
+import hashlib
+from functools import cached_property, lru_cache
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
-from django.utils.html import format_html
-from django.urls import reverse
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import BooleanField, Case, Count, F, IntegerField, OuterRef, Prefetch, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from django.urls import get_script_prefix, reverse
 from django.utils.safestring import mark_safe
 from .models import (
     Country, League, Team, Fixture, MatchPredict, 
     UserGroup, GroupMembership, GroupInvitation, UserProfile, Season,
     GroupLeagueRound, GroupDateSelection
 )
+from .signals import (
+    ACTIVE_LEAGUES_LOOKUP_CACHE_KEY, ACTIVE_LEAGUE_SEASONS_LOOKUP_CACHE_KEY, ADMIN_COUNT_VERSION_CACHE_KEY
+)
+
+# Filter choices change rarely; signals clear them on writes, the timeout is a safety net
+LOOKUP_CACHE_TIMEOUT = 300
+# Changelist counts; signals drop them on saves/deletes, bulk writes show up after the timeout
+COUNT_CACHE_TIMEOUT = 60
+
+
+def changelist_url(model_name):
+    """Reverse an app changelist URL once instead of on every rendered row"""
+    # reverse() prepends the request's script prefix, so it is part of the cache key
+    return _changelist_url(get_script_prefix(), model_name)
+
+
+@lru_cache(maxsize=None)
+def _changelist_url(script_prefix, model_name):
+    return reverse(f'admin:football_app_{model_name}_changelist')
+
+
+@lru_cache(maxsize=None)
+def changelist_link_prefix(url, lookup):
+    """Escaped '<a href="...?lookup=' prefix for a filtered changelist link"""
+    return f'<a href="{escape(url)}?{lookup}='
+
+
+def count_link(model_name, lookup, pk, count, label):
+    """Link a row's related-object count to the filtered changelist"""
+    # pk and count are integers, so only the cached prefix needed escaping
+    return mark_safe(f'{changelist_link_prefix(changelist_url(model_name), lookup)}{pk}">{count} {label}</a>')
+
+
+def related_count(queryset, field):
+    """Correlated COUNT of `queryset` rows whose `field` points at the outer row.
+    
+    Unlike Count() over a JOIN this needs no GROUP BY, so the changelist paginator's
+    count() drops it and only the displayed page is counted.
+    """
+    related = queryset.filter(**{field: OuterRef('pk')}).order_by().values(field)
+    return Coalesce(
+        Subquery(related.annotate(count=Count('pk')).values('count'), output_field=IntegerField()),
+        Value(0)
+    )
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that caches the COUNT(*) per model and query for repeated changelist navigation"""
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        model_label = queryset.model._meta.label_lower
+        version = cache.get(ADMIN_COUNT_VERSION_CACHE_KEY.format(model_label))
+        digest = hashlib.md5(f'{queryset.db}:{sql}:{params}'.encode()).hexdigest()
+        return cache.get_or_set(
+            f'admin:count:{model_label}:{version}:{digest}',
+            lambda: Paginator.count.func(self),
+            COUNT_CACHE_TIMEOUT
+        )
+
+
+class EstimatedCountPaginator(CachedCountPaginator):
+    """Paginator that uses PostgreSQL's row estimate for unfiltered changelists of large tables"""
+    # Below this an exact COUNT(*) is cheap, and estimates for small tables are least reliable
+    EXACT_COUNT_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE relname = %s', [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+            if row and row[0] >= self.EXACT_COUNT_THRESHOLD:
+                return row[0]
+        return super().count
+
+
+class NarrowChangeList(ChangeList):
+    """Changelist that loads only the columns its rows display"""
+
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        if self.model_admin.list_only_fields:
+            queryset = queryset.only(*self.model_admin.list_only_fields)
+        if self.model_admin.list_defer_fields:
+            queryset = queryset.defer(*self.model_admin.list_defer_fields)
+        return queryset
+
+
+class AutocompleteLabelMixin:
+    """Join what __str__ reads, so autocomplete results don't cost a query per option"""
+    label_select_related = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        # The changelist skips list_select_related once select_related() is set, so carry it along
+        return queryset.select_related(*self.label_select_related, *self.list_select_related), may_have_duplicates
+
+
+class NarrowChangeListMixin:
+    """Trim changelist row queries without affecting the change form"""
+    list_only_fields = ()
+    list_defer_fields = ()
+
+    def get_changelist(self, request, **kwargs):
+        return NarrowChangeList
 
 
 # Custom admin filters
+def active_league_choices():
+    return tuple(
+        (league_id, f"{name} ({country_name})")
+        for league_id, name, country_name in League.objects.filter(is_active=True).order_by('name').values_list('id', 'name', 'country__name')
+    )
+
+
+def active_league_season_choices():
+    return tuple(
+        (season_id, f"{name} ({league_name})")
+        for season_id, name, league_name in Season.objects.filter(league__is_active=True).order_by('-start_year', 'league__name').values_list('id', 'name', 'league__name')
+    )
+
+
 class ActiveLeagueFilter(admin.SimpleListFilter):
     title = 'league'
     parameter_name = 'league'
 
     def lookups(self, request, model_admin):
         """Return only active leagues"""
-        active_leagues = League.objects.filter(is_active=True).order_by('name')
-        return [(league.id, str(league)) for league in active_leagues]
+        # The cache holds the finished choice tuples, so a hit does no query and no formatting
+        return cache.get_or_set(ACTIVE_LEAGUES_LOOKUP_CACHE_KEY, active_league_choices, LOOKUP_CACHE_TIMEOUT)
 
     def queryset(self, request, queryset):
         """Filter queryset based on selected league"""
@@ -34,8 +171,7 @@ class ActiveLeagueSeasonFilter(admin.SimpleListFilter):
 
     def lookups(self, request, model_admin):
         """Return only seasons from active leagues"""
-        active_league_seasons = Season.objects.filter(league__is_active=True).order_by('-start_year', 'league__name')
-        return [(season.id, str(season)) for season in active_league_seasons]
+        return cache.get_or_set(ACTIVE_LEAGUE_SEASONS_LOOKUP_CACHE_KEY, active_league_season_choices, LOOKUP_CACHE_TIMEOUT)
 
     def queryset(self, request, queryset):
         """Filter queryset based on selected season"""
@@ -44,6 +180,26 @@ class ActiveLeagueSeasonFilter(admin.SimpleListFilter):
         return queryset
 
 
+class LabelRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """Related filter that joins what the option labels (__str__) read instead of one query per option"""
+    label_select_related = ()
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        queryset = field.remote_field.model._default_manager.select_related(*self.label_select_related)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return [(obj.pk, str(obj)) for obj in queryset]
+
+
+class LeagueListFilter(LabelRelatedFieldListFilter):
+    label_select_related = ('country',)
+
+
+class SeasonListFilter(LabelRelatedFieldListFilter):
+    label_select_related = ('league',)
+
+
 # Inline admin classes
 class LeagueInline(admin.TabularInline):
     model = League
@@ -62,6 +218,11 @@ class GroupMembershipInline(admin.TabularInline):
     extra = 1
     fields = ('user', 'role', 'total_points', 'is_active')
     readonly_fields = ('total_points',)
+    autocomplete_fields = ('user',)
+    
+    def get_queryset(self, request):
+        # Each row's label (__str__) reads the user and the group
+        return super().get_queryset(request).select_related('user', 'group')
 
 
 class MatchPredictInline(admin.TabularInline):
@@ -69,13 +230,30 @@ class MatchPredictInline(admin.TabularInline):
     extra = 0
     fields = ('user', 'predicted_result', 'predicted_home_score', 'predicted_away_score', 'points_earned')
     readonly_fields = ('points_earned',)
+    autocomplete_fields = ('user',)
+    
+    def get_queryset(self, request):
+        # Each row's label (__str__) reads the user and both teams of the match
+        return super().get_queryset(request).select_related('user', 'match__home_team', 'match__away_team')
 
 
 # Main admin classes
 @admin.register(Season)
-class SeasonAdmin(admin.ModelAdmin):
+class SeasonAdmin(AutocompleteLabelMixin, NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ('name', 'league', 'start_year', 'end_year', 'start_date', 'end_date', 'is_current', 'is_active', 'match_count', 'created_at')
-    list_filter = ('league', 'is_current', 'is_active', 'start_year')
+    list_select_related = ('league__country',)
+    label_select_related = ('league',)
+    
+    COVERAGE_FIELDS = (
+        'coverage_fixtures_events', 'coverage_fixtures_lineups', 
+        'coverage_fixtures_statistics_fixtures', 'coverage_fixtures_statistics_players',
+        'coverage_standings', 'coverage_players', 'coverage_top_scorers',
+        'coverage_top_assists', 'coverage_top_cards', 'coverage_injuries',
+        'coverage_predictions', 'coverage_odds'
+    )
+    # Only shown in the collapsed fieldset of the change form
+    list_defer_fields = COVERAGE_FIELDS
+    list_filter = (('league', LeagueListFilter), 'is_current', 'is_active', 'start_year')
     search_fields = ('name', 'start_year', 'end_year', 'league__name')
     list_editable = ('is_current', 'is_active')
     date_hierarchy = 'start_date'
@@ -91,46 +269,51 @@ class SeasonAdmin(admin.ModelAdmin):
             'fields': ('is_current', 'is_active')
         }),
         ('Coverage', {
-            'fields': (
-                'coverage_fixtures_events', 'coverage_fixtures_lineups', 
-                'coverage_fixtures_statistics_fixtures', 'coverage_fixtures_statistics_players',
-                'coverage_standings', 'coverage_players', 'coverage_top_scorers',
-                'coverage_top_assists', 'coverage_top_cards', 'coverage_injuries',
-                'coverage_predictions', 'coverage_odds'
-            ),
+            'fields': COVERAGE_FIELDS,
             'classes': ('collapse',)
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_match_count=related_count(Fixture.objects, 'season'))
+    
     def match_count(self, obj):
-        count = obj.matches.count()
+        count = obj._match_count
         if count > 0:
-            url = reverse('admin:football_app_fixture_changelist') + f'?season__id__exact={obj.id}'
-            return format_html('<a href="{}">{} matches</a>', url, count)
+            return count_link('fixture', 'season__id__exact', obj.id, count, 'matches')
         return "0"
     match_count.short_description = 'Matches'
+    match_count.admin_order_field = '_match_count'
     
     actions = ['set_as_current_season']
     
     def set_as_current_season(self, request, queryset):
         """Set selected season as current (only one per league allowed)"""
-        if queryset.count() != 1:
+        # Fetching at most two rows answers "exactly one?" without a separate COUNT;
+        # only the columns used below, and none of the changelist annotations
+        seasons = list(
+            Season.objects.filter(pk__in=queryset.values('pk'))
+            .select_related('league')
+            .only('name', 'league__name')[:2]
+        )
+        if len(seasons) != 1:
             self.message_user(request, 'Please select exactly one season to set as current.', level='ERROR')
             return
         
-        season = queryset.first()
-        if season.league:
-            # Set as current for this league only
-            Season.objects.filter(league=season.league, is_current=True).update(is_current=False)
-            season.is_current = True
-            season.save()
-            self.message_user(request, f'Set {season.name} as the current season for {season.league.name}.')
-        else:
-            # Set as current globally (for seasons without league)
-            Season.objects.filter(is_current=True).update(is_current=False)
-            season.is_current = True
-            season.save()
-            self.message_user(request, f'Set {season.name} as the current season.')
+        season = seasons[0]
+        # Demote and promote together so there is never a moment without a current season
+        # Only the flag is written; the one_current_season_per_league constraint guards the invariant
+        with transaction.atomic():
+            if season.league:
+                # Set as current for this league only
+                Season.objects.filter(league=season.league, is_current=True).update(is_current=False)
+                Season.objects.filter(pk=season.pk).update(is_current=True)
+                self.message_user(request, f'Set {season.name} as the current season for {season.league.name}.')
+            else:
+                # Set as current globally (for seasons without league)
+                Season.objects.filter(is_current=True).update(is_current=False)
+                Season.objects.filter(pk=season.pk).update(is_current=True)
+                self.message_user(request, f'Set {season.name} as the current season.')
     set_as_current_season.short_description = 'Set as current season'
 
 
@@ -141,43 +324,69 @@ class CountryAdmin(admin.ModelAdmin):
     search_fields = ('name', 'code')
     inlines = [LeagueInline]
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _league_count=related_count(League.objects, 'country'),
+            _team_count=related_count(Team.objects, 'country'),
+        )
+    
     def league_count(self, obj):
-        return obj.leagues.count()
+        return obj._league_count
     league_count.short_description = 'Leagues'
+    league_count.admin_order_field = '_league_count'
     
     def team_count(self, obj):
-        return obj.teams.count()
+        return obj._team_count
     team_count.short_description = 'Teams'
+    team_count.admin_order_field = '_team_count'
 
 
 @admin.register(League)
-class LeagueAdmin(admin.ModelAdmin):
+class LeagueAdmin(AutocompleteLabelMixin, admin.ModelAdmin):
     list_display = ('name', 'country', 'level', 'team_count', 'season_count', 'match_count', 'is_active', 'created_at')
+    list_select_related = ('country',)
+    label_select_related = ('country',)
     list_filter = ('country', 'level', 'is_active', 'created_at')
     search_fields = ('name', 'country__name')
     list_editable = ('is_active',)
     inlines = [SeasonInline]
     
+    # Unique teams that have played in the league, home or away; UNION does the dedup
+    TEAM_COUNT_SQL = (
+        'SELECT COUNT(*) FROM ('
+        'SELECT home_team_id FROM football_app_fixture WHERE league_id = football_app_league.id '
+        'UNION '
+        'SELECT away_team_id FROM football_app_fixture WHERE league_id = football_app_league.id'
+        ') AS league_teams'
+    )
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _team_count=RawSQL(self.TEAM_COUNT_SQL, ()),
+            _season_count=related_count(Season.objects, 'league'),
+            _match_count=related_count(Fixture.objects, 'league'),
+        )
+    
     def team_count(self, obj):
-        # Count unique teams that have played in this league
-        home_teams = obj.matches.values_list('home_team_id', flat=True).distinct()
-        away_teams = obj.matches.values_list('away_team_id', flat=True).distinct()
-        unique_teams = set(home_teams) | set(away_teams)
-        return len(unique_teams)
+        return obj._team_count
     team_count.short_description = 'Teams'
+    team_count.admin_order_field = '_team_count'
     
     def season_count(self, obj):
-        return obj.seasons.count()
+        return obj._season_count
     season_count.short_description = 'Seasons'
+    season_count.admin_order_field = '_season_count'
     
     def match_count(self, obj):
-        return obj.matches.count()
+        return obj._match_count
     match_count.short_description = 'Matches'
+    match_count.admin_order_field = '_match_count'
 
 
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
     list_display = ('name', 'code', 'country', 'founded_year', 'is_active')
+    list_select_related = ('country',)
     list_filter = ('country', 'is_active', 'created_at')
     search_fields = ('name', 'code', 'country__name')
     list_editable = ('is_active',)
@@ -185,12 +394,23 @@ class TeamAdmin(admin.ModelAdmin):
 
 
 @admin.register(Fixture)
-class FixtureAdmin(admin.ModelAdmin):
+class FixtureAdmin(AutocompleteLabelMixin, NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ('match_display', 'league', 'season', 'date', 'score_display', 'status_long', 'prediction_count')
-    list_filter = ('league', 'season', 'status_long', 'date', 'created_at')
+    list_select_related = ('home_team', 'away_team', 'league__country', 'season__league')
+    list_only_fields = (
+        'date', 'home_goals', 'away_goals', 'status_long',
+        'home_team__name', 'away_team__name',
+        'league__name', 'league__country__name',
+        'season__name', 'season__league__name'
+    )
+    list_filter = (('league', LeagueListFilter), ('season', SeasonListFilter), 'status_long', 'date', 'created_at')
     search_fields = ('home_team__name', 'away_team__name', 'league__name', 'season__name')
     list_editable = ('status_long',)
     date_hierarchy = 'date'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    autocomplete_fields = ('home_team', 'away_team', 'league', 'season')
+    label_select_related = ('home_team', 'away_team')
     inlines = [MatchPredictInline]
     
     fieldsets = (
@@ -216,33 +436,39 @@ class FixtureAdmin(admin.ModelAdmin):
         return "-"
     score_display.short_description = 'Score'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_prediction_count=related_count(MatchPredict.objects, 'match'))
+    
     def prediction_count(self, obj):
-        count = obj.predictions.count()
+        count = obj._prediction_count
         if count > 0:
-            url = reverse('admin:football_app_matchpredict_changelist') + f'?match__id__exact={obj.id}'
-            return format_html('<a href="{}">{} predictions</a>', url, count)
+            return count_link('matchpredict', 'match__id__exact', obj.id, count, 'predictions')
         return "0"
     prediction_count.short_description = 'Predictions'
+    prediction_count.admin_order_field = '_prediction_count'
     
     actions = ['calculate_points_for_predictions']
     
     def calculate_points_for_predictions(self, request, queryset):
         """Calculate points for all predictions of selected matches"""
-        total_updated = 0
-        for match in queryset.filter(status_long='Match Finished'):
-            for prediction in match.predictions.all():
-                prediction.calculate_points()
-                total_updated += 1
-        self.message_user(request, f'Updated points for {total_updated} predictions.')
+        updated, total = MatchPredict.bulk_calculate_points(MatchPredict.objects.filter(
+            match__in=queryset.values('pk'),
+            match__status_long='Match Finished'
+        ))
+        self.message_user(request, f'Updated points for {updated} of {total} predictions.')
     calculate_points_for_predictions.short_description = 'Calculate points for predictions'
 
 
 @admin.register(MatchPredict)
 class MatchPredictAdmin(admin.ModelAdmin):
     list_display = ('user', 'match_display', 'predicted_result_display', 'actual_result', 'points_earned', 'is_correct_display', 'created_at')
-    list_filter = ('predicted_result', 'match__status_long', 'match__league', 'created_at')
+    list_select_related = ('user', 'match__home_team', 'match__away_team')
+    list_filter = ('predicted_result', 'match__status_long', ('match__league', LeagueListFilter), 'created_at')
     search_fields = ('user__username', 'match__home_team__name', 'match__away_team__name')
     readonly_fields = ('points_earned', 'created_at', 'updated_at')
+    autocomplete_fields = ('user', 'match')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Prediction', {
@@ -257,6 +483,22 @@ class MatchPredictAdmin(admin.ModelAdmin):
         }),
     )
     
+    RESULT_LABELS = dict(MatchPredict.PREDICTION_CHOICES)
+    CORRECT_LABEL = mark_safe('<span style="color: green;">✓ Correct</span>')
+    WRONG_LABEL = mark_safe('<span style="color: red;">✗ Wrong</span>')
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _match_result=Fixture.result_expression('match__'),
+            # None while the match is not finished, like MatchPredict.is_correct
+            _is_correct=Case(
+                When(~Q(match__status_long='Match Finished'), then=Value(None)),
+                When(predicted_result=F('_match_result'), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            )
+        )
+    
     def match_display(self, obj):
         return f"{obj.match.home_team} vs {obj.match.away_team}"
     match_display.short_description = 'Match'
@@ -269,39 +511,33 @@ class MatchPredictAdmin(admin.ModelAdmin):
     predicted_result_display.short_description = 'Prediction'
     
     def actual_result(self, obj):
-        if obj.match.status_long == 'Match Finished':
-            result_text = ""
-            # Determine result based on goals
-            if obj.match.home_goals is not None and obj.match.away_goals is not None:
-                if obj.match.home_goals > obj.match.away_goals:
-                    result_text = "Home Win"
-                elif obj.match.away_goals > obj.match.home_goals:
-                    result_text = "Away Win"
-                else:
-                    result_text = "Draw"
-                return f"{result_text} ({obj.match.home_goals}-{obj.match.away_goals})"
+        match = obj.match
+        if match.status_long == 'Match Finished':
+            # _match_result is computed by the database from the goals
+            if obj._match_result is not None:
+                return f"{self.RESULT_LABELS[obj._match_result]} ({match.home_goals}-{match.away_goals})"
             else:
                 return "Unknown"
-        return obj.match.status_long or "Pending"
+        return match.status_long or "Pending"
     actual_result.short_description = 'Actual Result'
     
     def is_correct_display(self, obj):
-        if obj.match.status_long == 'Match Finished':
-            if obj.is_correct:
-                return format_html('<span style="color: green;">✓ Correct</span>')
-            else:
-                return format_html('<span style="color: red;">✗ Wrong</span>')
-        return "Pending"
+        if obj._is_correct is None:
+            return "Pending"
+        return self.CORRECT_LABEL if obj._is_correct else self.WRONG_LABEL
     is_correct_display.short_description = 'Result'
+    is_correct_display.admin_order_field = '_is_correct'
 
 
 @admin.register(UserGroup)
-class UserGroupAdmin(admin.ModelAdmin):
+class UserGroupAdmin(NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ('name', 'creator', 'member_count', 'league_count', 'is_private', 'join_code', 'is_active', 'created_at')
+    list_select_related = ('creator',)
+    list_defer_fields = ('description',)
     list_filter = ('is_private', 'is_active', 'created_at')
     search_fields = ('name', 'creator__username', 'description')
     list_editable = ('is_active',)
-    filter_horizontal = ('leagues',)
+    autocomplete_fields = ('creator', 'leagues')
     inlines = [GroupMembershipInline]
     
     fieldsets = (
@@ -316,25 +552,41 @@ class UserGroupAdmin(admin.ModelAdmin):
         }),
     )
     
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'leagues':
+            # The autocomplete widget labels the selected leagues with "name (country)"
+            kwargs['queryset'] = League.objects.select_related('country')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _member_count=related_count(GroupMembership.objects, 'group'),
+        )
+    
     def member_count(self, obj):
-        count = obj.members.count()
+        count = obj._member_count
         if count > 0:
-            url = reverse('admin:football_app_groupmembership_changelist') + f'?group__id__exact={obj.id}'
-            return format_html('<a href="{}">{} members</a>', url, count)
+            return count_link('groupmembership', 'group__id__exact', obj.id, count, 'members')
         return "0"
     member_count.short_description = 'Members'
+    member_count.admin_order_field = '_member_count'
     
     def league_count(self, obj):
-        return obj.leagues.count()
+        return obj.leagues_count
     league_count.short_description = 'Leagues'
+    league_count.admin_order_field = 'leagues_count'
 
 
 @admin.register(GroupMembership)
 class GroupMembershipAdmin(admin.ModelAdmin):
     list_display = ('user', 'group', 'role', 'total_points', 'accuracy_display', 'joined_at', 'is_active')
+    list_select_related = ('user', 'group')
     list_filter = ('role', 'is_active', 'joined_at', 'group')
     search_fields = ('user__username', 'group__name')
     list_editable = ('role', 'is_active')
+    autocomplete_fields = ('user', 'group')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Membership', {
@@ -354,18 +606,20 @@ class GroupMembershipAdmin(admin.ModelAdmin):
     
     def update_member_stats(self, request, queryset):
         """Update statistics for selected memberships"""
-        for membership in queryset:
-            membership.update_stats()
-        self.message_user(request, f'Updated statistics for {queryset.count()} memberships.')
+        updated = GroupMembership.bulk_update_stats(queryset.select_related('group'))
+        self.message_user(request, f'Updated statistics for {updated} memberships.')
     update_member_stats.short_description = 'Update member statistics'
 
 
 @admin.register(GroupInvitation)
-class GroupInvitationAdmin(admin.ModelAdmin):
+class GroupInvitationAdmin(NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ('invitee', 'group', 'inviter', 'status', 'created_at', 'responded_at')
+    list_select_related = ('invitee', 'group', 'inviter')
+    list_defer_fields = ('message',)
     list_filter = ('status', 'created_at')
     search_fields = ('invitee__username', 'inviter__username', 'group__name')
     list_editable = ('status',)
+    autocomplete_fields = ('group', 'inviter', 'invitee')
     
     fieldsets = (
         ('Invitation', {
@@ -378,10 +632,13 @@ class GroupInvitationAdmin(admin.ModelAdmin):
 
 
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ('user', 'total_points', 'total_predictions', 'accuracy_display', 'favorite_team', 'created_at')
+    list_select_related = ('user', 'favorite_team')
+    list_defer_fields = ('bio', 'avatar_image')
     list_filter = ('created_at', 'favorite_team')
     search_fields = ('user__username', 'user__first_name', 'user__last_name')
+    autocomplete_fields = ('user', 'favorite_team')
     
     fieldsets = (
         ('Profile', {
@@ -401,9 +658,8 @@ class UserProfileAdmin(admin.ModelAdmin):
     
     def update_user_stats(self, request, queryset):
         """Update statistics for selected user profiles"""
-        for profile in queryset:
-            profile.update_stats()
-        self.message_user(request, f'Updated statistics for {queryset.count()} user profiles.')
+        updated = UserProfile.bulk_update_stats(queryset)
+        self.message_user(request, f'Updated statistics for {updated} user profiles.')
     update_user_stats.short_description = 'Update user statistics'
 
 
@@ -414,6 +670,11 @@ class UserProfileInline(admin.StackedInline):
     verbose_name_plural = 'Profile'
     fields = ('bio', 'favorite_team', 'avatar_image', 'total_points', 'total_predictions', 'correct_predictions')
     readonly_fields = ('total_points', 'total_predictions', 'correct_predictions')
+    autocomplete_fields = ('favorite_team',)
+    
+    def get_queryset(self, request):
+        # The inline's label (__str__) reads the user
+        return super().get_queryset(request).select_related('user')
 
 
 class UserAdmin(BaseUserAdmin):
@@ -428,8 +689,10 @@ admin.site.register(User, UserAdmin)
 @admin.register(GroupLeagueRound)
 class GroupLeagueRoundAdmin(admin.ModelAdmin):
     list_display = ('group', 'league', 'season', 'round_number', 'created_at')
+    list_select_related = ('group', 'league__country', 'season__league')
     list_filter = (ActiveLeagueFilter, ActiveLeagueSeasonFilter, 'created_at')
     search_fields = ('group__name', 'league__name', 'round_number')
+    autocomplete_fields = ('group', 'league', 'season')
     
     fieldsets = (
         ('Round Selection', {
@@ -449,9 +712,10 @@ class GroupLeagueRoundAdmin(admin.ModelAdmin):
 @admin.register(GroupDateSelection) 
 class GroupDateSelectionAdmin(admin.ModelAdmin):
     list_display = ('group', 'match_date', 'leagues_display', 'description', 'created_at')
+    list_select_related = ('group',)
     list_filter = ('match_date', 'created_at')
     search_fields = ('group__name', 'description')
-    filter_horizontal = ('specific_leagues',)
+    autocomplete_fields = ('group', 'specific_leagues')
     
     fieldsets = (
         ('Date Selection', {
@@ -463,14 +727,26 @@ class GroupDateSelectionAdmin(admin.ModelAdmin):
         }),
     )
     
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'specific_leagues':
+            # The autocomplete widget labels the selected leagues with "name (country)"
+            kwargs['queryset'] = League.objects.select_related('country')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(
+            Prefetch('specific_leagues', queryset=League.objects.only('id', 'name'))
+        )
+    
     def leagues_display(self, obj):
-        if obj.specific_leagues.exists():
-            count = obj.specific_leagues.count()
-            if count <= 3:
-                return ', '.join([league.name for league in obj.specific_leagues.all()])
+        # Read from the prefetch cache; exists()/count()/slicing would each query
+        leagues = list(obj.specific_leagues.all())
+        if leagues:
+            if len(leagues) <= 3:
+                return ', '.join([league.name for league in leagues])
             else:
-                names = ', '.join([league.name for league in obj.specific_leagues.all()[:3]])
-                return f"{names} and {count - 3} more"
+                names = ', '.join([league.name for league in leagues[:3]])
+                return f"{names} and {len(leagues) - 3} more"
         return "All active leagues"
     leagues_display.short_description = 'Leagues'
 
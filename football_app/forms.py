@@ -1,9 +1,83 @@
+import copy
 from django import forms
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm
 from django.core.exceptions import ValidationError
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Exists, OuterRef, Q, When
+from django.forms.models import ModelChoiceIterator
 from django.utils import timezone
 from .models import MatchPredict, Fixture, UserGroup, UserProfile, League, GroupInvitation, GroupMembership
+from .signals import ACTIVE_LEAGUE_IDS_CACHE_KEY, invalidate_admin_counts
+
+
+# Active leagues change rarely; signals clear the ids on writes, the timeout is a safety net
+ACTIVE_LEAGUE_IDS_CACHE_TIMEOUT = 300
+# Result options for BulkPredictionForm, with an empty choice for matches left unpredicted
+BULK_RESULT_CHOICES = (('', 'Select Result'),) + tuple(MatchPredict.PREDICTION_CHOICES)
+# Rows per INSERT/UPDATE statement for bulk writes, keeping each statement under PostgreSQL's parameter limit
+BULK_BATCH_SIZE = 500
+# Largest round range accepted in CreateGroupForm, e.g. "1-38" for a league season
+MAX_ROUND_RANGE = 100
+
+
+def active_league_ids():
+    """Ids of the active leagues, shared by every CreateGroupForm"""
+    return cache.get_or_set(
+        ACTIVE_LEAGUE_IDS_CACHE_KEY,
+        lambda: tuple(League.objects.filter(is_active=True).values_list('id', flat=True)),
+        ACTIVE_LEAGUE_IDS_CACHE_TIMEOUT
+    )
+
+
+def parse_round_numbers(round_numbers):
+    """Expand "1, 3-5, Final" into ['1', '3', '4', '5', 'Final'], dropping blanks and repeats"""
+    rounds = {}
+    for round_part in round_numbers.split(','):
+        round_part = round_part.strip()
+        start, dash, end = round_part.partition('-')
+        if dash and start.isdigit() and end.isdigit():
+            # Handle ranges like "1-5", refusing ranges too large to be real rounds
+            if int(end) - int(start) + 1 > MAX_ROUND_RANGE:
+                raise ValidationError(f"Round ranges can span at most {MAX_ROUND_RANGE} rounds.")
+            rounds.update(dict.fromkeys(map(str, range(int(start), int(end) + 1))))
+        elif round_part:
+            # Handle individual rounds
+            rounds[round_part] = None
+    return list(rounds)
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """Iterate the field's queryset itself, so its result cache is filled once and reused"""
+    
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.queryset:
+            yield self.choice(obj)
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """ModelMultipleChoiceField that renders and validates from one evaluation of its queryset"""
+    iterator = CachedModelChoiceIterator
+    
+    def _check_values(self, value):
+        key = self.to_field_name or 'pk'
+        try:
+            value = frozenset(value)
+        except TypeError:
+            raise ValidationError(self.error_messages['invalid_list'], code='invalid_list')
+        # Check the submitted values against the loaded choices instead of another query
+        choices = {str(getattr(obj, key)): obj for obj in self.queryset}
+        for val in value:
+            if str(val) not in choices:
+                raise ValidationError(
+                    self.error_messages['invalid_choice'],
+                    code='invalid_choice',
+                    params={'value': val},
+                )
+        return self.queryset.filter(pk__in=[choices[str(val)].pk for val in value])
 
 
 class MatchPredictionForm(forms.ModelForm):
@@ -93,12 +167,13 @@ class MatchPredictionForm(forms.ModelForm):
                 cleaned_data['predicted_result'] = auto_result
 
         # Validate that match is still open for predictions
-        if self.match:
-            if self.match.status_long in ['Match Finished', 'In Progress', 'First Half, Kick Off', 'Second Half, 2nd Half Started', 'Extra Time', 'Penalty In Progress']:
+        match = self.match
+        if match:
+            if match.status_long in Fixture.FINISHED_OR_LIVE_STATUSES:
                 raise ValidationError("Cannot make predictions for finished or live matches.")
             
             # Check if prediction deadline has passed (e.g., 1 hour before match)
-            if self.match.date <= timezone.now():
+            if match.date <= timezone.now():
                 raise ValidationError("Prediction deadline has passed for this match.")
 
         return cleaned_data
@@ -116,65 +191,92 @@ class MatchPredictionForm(forms.ModelForm):
 
 
 class BulkPredictionForm(forms.Form):
-    """Form for making predictions on multiple matches at once"""
+    """Form for making predictions on multiple matches at once
+    
+    Three fields are built per match, so callers should pass a bounded page
+    of matches (e.g. a sliced queryset) rather than every upcoming fixture.
+    clean() reads status_long and date from each match, so neither may be
+    deferred, and match labels use the teams, so select_related('home_team',
+    'away_team', 'league') avoids a query per match when rendering.
+    """
     
     def __init__(self, *args, **kwargs):
         matches = kwargs.pop('matches', [])
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         
+        # Evaluate the matches once so clean() and save() reuse the same rows
+        matches = list(matches)
         self.matches = matches
         self.user = user
         
-        # Create fields for each match
+        # Load the user's existing predictions for these matches in one query;
+        # they only seed initial values, which bound forms never display
+        existing_predictions = {}
+        if user and not self.is_bound:
+            existing_predictions = {
+                prediction['match_id']: prediction
+                for prediction in MatchPredict.objects.filter(
+                    user=user,
+                    match_id__in=[match.id for match in matches]
+                ).values('match_id', 'predicted_result', 'predicted_home_score', 'predicted_away_score')
+            }
+        
+        # Build each kind of field once; the per-match fields are shallow copies
+        # sharing its widget, which gets the field name only when rendering
+        result_field = forms.ChoiceField(
+            choices=BULK_RESULT_CHOICES,
+            required=False,
+            widget=forms.Select(attrs={'class': 'form-select form-select-sm'})
+        )
+        score_field = forms.IntegerField(
+            required=False,
+            min_value=0,
+            max_value=20,
+            widget=forms.NumberInput(attrs={
+                'class': 'form-control form-control-sm',
+                'placeholder': '0'
+            })
+        )
+        
+        # Create fields for each match, then add them to the form in one update
+        new_fields = {}
+        self.match_field_names = {}
         for match in matches:
             field_prefix = f'match_{match.id}'
+            self.match_field_names[match.id] = {
+                'result': f'{field_prefix}_result',
+                'home_score': f'{field_prefix}_home_score',
+                'away_score': f'{field_prefix}_away_score',
+            }
             
-            # Result field
-            self.fields[f'{field_prefix}_result'] = forms.ChoiceField(
-                choices=[('', 'Select Result')] + MatchPredict.PREDICTION_CHOICES,
-                required=False,
-                widget=forms.Select(attrs={'class': 'form-select form-select-sm'})
-            )
-            
-            # Home score field
-            self.fields[f'{field_prefix}_home_score'] = forms.IntegerField(
-                required=False,
-                min_value=0,
-                max_value=20,
-                widget=forms.NumberInput(attrs={
-                    'class': 'form-control form-control-sm',
-                    'placeholder': '0'
-                })
-            )
-            
-            # Away score field
-            self.fields[f'{field_prefix}_away_score'] = forms.IntegerField(
-                required=False,
-                min_value=0,
-                max_value=20,
-                widget=forms.NumberInput(attrs={
-                    'class': 'form-control form-control-sm',
-                    'placeholder': '0'
-                })
-            )
+            match_result_field = new_fields[f'{field_prefix}_result'] = copy.copy(result_field)
+            home_score_field = new_fields[f'{field_prefix}_home_score'] = copy.copy(score_field)
+            away_score_field = new_fields[f'{field_prefix}_away_score'] = copy.copy(score_field)
             
             # Check if user already has a prediction for this match
-            if user:
-                try:
-                    existing_prediction = MatchPredict.objects.get(user=user, match=match)
-                    self.fields[f'{field_prefix}_result'].initial = existing_prediction.predicted_result
-                    self.fields[f'{field_prefix}_home_score'].initial = existing_prediction.predicted_home_score
-                    self.fields[f'{field_prefix}_away_score'].initial = existing_prediction.predicted_away_score
-                except MatchPredict.DoesNotExist:
-                    pass
+            existing_prediction = existing_predictions.get(match.id)
+            if existing_prediction:
+                match_result_field.initial = existing_prediction['predicted_result']
+                home_score_field.initial = existing_prediction['predicted_home_score']
+                away_score_field.initial = existing_prediction['predicted_away_score']
+        self.fields.update(new_fields)
+
+    def get_match_fields(self, match_id):
+        """Bound result and score fields of one match, keyed 'result', 'home_score' and 'away_score'"""
+        field_names = self.match_field_names.get(match_id, {})
+        return {key: self[name] for key, name in field_names.items()}
 
     def clean(self):
         cleaned_data = super().clean()
+        now = timezone.now()
         
+        # Validated predictions keyed by match id, for save()
+        self.predictions_by_match = {}
         for match in self.matches:
             field_prefix = f'match_{match.id}'
-            result = cleaned_data.get(f'{field_prefix}_result')
+            result_key = f'{field_prefix}_result'
+            result = cleaned_data.get(result_key)
             home_score = cleaned_data.get(f'{field_prefix}_home_score')
             away_score = cleaned_data.get(f'{field_prefix}_away_score')
             
@@ -182,59 +284,74 @@ class BulkPredictionForm(forms.Form):
             if not result and home_score is None and away_score is None:
                 continue
             
-            # Validate that match is still open for predictions
-            if match.status_long in ['Match Finished', 'In Progress', 'First Half, Kick Off', 'Second Half, 2nd Half Started', 'Extra Time', 'Penalty In Progress']:
-                raise ValidationError(f"Cannot make predictions for {match} - match is {match.get_status_display().lower()}.")
+            # Validate that match is still open for predictions; errors go on the
+            # match's result field so every invalid match is reported in one pass
+            if match.status_long in Fixture.FINISHED_OR_LIVE_STATUSES:
+                self.add_error(result_key, f"Cannot make predictions for {match} - match is {match.get_status_display().lower()}.")
+                continue
             
-            if match.date <= timezone.now():
-                raise ValidationError(f"Prediction deadline has passed for {match}.")
+            if match.date <= now:
+                self.add_error(result_key, f"Prediction deadline has passed for {match}.")
+                continue
             
             # If result is provided, it's required
             if not result:
-                raise ValidationError(f"Please select a result for {match}.")
+                self.add_error(result_key, f"Please select a result for {match}.")
+                continue
             
             # Validate score consistency if both scores are provided
             if home_score is not None and away_score is not None:
                 if home_score > away_score and result != 'H':
-                    cleaned_data[f'{field_prefix}_result'] = 'H'
+                    result = cleaned_data[result_key] = 'H'
                 elif away_score > home_score and result != 'A':
-                    cleaned_data[f'{field_prefix}_result'] = 'A'
+                    result = cleaned_data[result_key] = 'A'
                 elif home_score == away_score and result != 'D':
-                    cleaned_data[f'{field_prefix}_result'] = 'D'
+                    result = cleaned_data[result_key] = 'D'
+            
+            self.predictions_by_match[match.id] = (match, result, home_score, away_score)
 
         return cleaned_data
 
     def save(self):
         """Save all predictions"""
-        predictions_created = 0
-        predictions_updated = 0
+        # Nothing to save when no match got a result
+        if not self.predictions_by_match:
+            return 0, 0
         
-        for match in self.matches:
-            field_prefix = f'match_{match.id}'
-            result = self.cleaned_data.get(f'{field_prefix}_result')
-            home_score = self.cleaned_data.get(f'{field_prefix}_home_score')
-            away_score = self.cleaned_data.get(f'{field_prefix}_away_score')
-            
-            # Skip if no prediction is made
-            if not result:
-                continue
-            
-            # Create or update prediction
-            prediction, created = MatchPredict.objects.update_or_create(
+        predictions = [
+            MatchPredict(
                 user=self.user,
                 match=match,
-                defaults={
-                    'predicted_result': result,
-                    'predicted_home_score': home_score,
-                    'predicted_away_score': away_score,
-                    'confidence_level': 50,  # Default confidence
-                }
+                predicted_result=result,
+                predicted_home_score=home_score,
+                predicted_away_score=away_score,
             )
-            
-            if created:
-                predictions_created += 1
-            else:
-                predictions_updated += 1
+            for match, result, home_score, away_score in self.predictions_by_match.values()
+        ]
+        
+        # Count the ones that already exist to report created vs updated
+        predictions_updated = MatchPredict.objects.filter(
+            user=self.user,
+            match_id__in=[prediction.match_id for prediction in predictions]
+        ).count()
+        
+        # Upsert on (user, match): one statement per batch inserts the new
+        # predictions and overwrites the existing ones, all in one transaction.
+        # New rows take the model's default confidence; existing rows keep theirs
+        MatchPredict.objects.bulk_create(
+            predictions,
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['user', 'match'],
+            update_fields=[
+                'predicted_result', 'predicted_home_score', 'predicted_away_score', 'updated_at'
+            ],
+        )
+        
+        predictions_created = len(predictions) - predictions_updated
+        # bulk_create() sends no post_save
+        if predictions_created:
+            invalidate_admin_counts(MatchPredict)
         
         return predictions_created, predictions_updated
 
@@ -242,7 +359,7 @@ class BulkPredictionForm(forms.Form):
 class PredictionFilterForm(forms.Form):
     """Form for filtering predictions by league, date, etc."""
     
-    league = forms.ModelMultipleChoiceField(
+    league = CachedModelMultipleChoiceField(
         queryset=None,  # Will be set in __init__
         required=False,
         widget=forms.CheckboxSelectMultiple(attrs={'class': 'form-check-input'})
@@ -275,15 +392,18 @@ class PredictionFilterForm(forms.Form):
         
         # Set league choices based on user's groups - only show active leagues
         if user_groups:
-            from .models import League
+            # An id subquery on the group links instead of a join that needs DISTINCT
             leagues = League.objects.filter(
-                prediction_groups__in=user_groups,
+                pk__in=UserGroup.leagues.through.objects.filter(usergroup__in=user_groups).values('league_id'),
                 is_active=True
-            ).distinct()
-            self.fields['league'].queryset = leagues
+            )
         else:
-            from .models import League
-            self.fields['league'].queryset = League.objects.filter(is_active=True)
+            # Without groups the view lists matches from every league, so offer them all
+            leagues = League.objects.filter(is_active=True)
+        # The checkbox labels (League.__str__) read the country name
+        self.fields['league'].queryset = leagues.select_related('country').only(
+            'id', 'name', 'country__name'
+        ).order_by('name')
 
 
 class UserSignUpForm(UserCreationForm):
@@ -347,7 +467,8 @@ class UserSignUpForm(UserCreationForm):
     
     def clean_email(self):
         email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
+        # Case-insensitive, served by the UPPER(email) index from migration 0005
+        if User.objects.filter(email__iexact=email).exists():
             raise ValidationError("A user with this email already exists.")
         return email
     
@@ -370,14 +491,16 @@ class UserSignUpForm(UserCreationForm):
         user.last_name = self.cleaned_data['last_name']
         
         if commit:
-            user.save()
-            # Create user profile
-            UserProfile.objects.create(
-                user=user,
-                first_name=self.cleaned_data['first_name'],
-                last_name=self.cleaned_data['last_name'],
-                birthday=self.cleaned_data['birthday']
-            )
+            # The user and the profile are committed together, never a user without a profile
+            with transaction.atomic():
+                user.save()
+                # Create user profile
+                UserProfile(
+                    user=user,
+                    first_name=self.cleaned_data['first_name'],
+                    last_name=self.cleaned_data['last_name'],
+                    birthday=self.cleaned_data['birthday']
+                ).save(force_insert=True)
         return user
 
 
@@ -478,15 +601,22 @@ class CreateGroupForm(forms.ModelForm):
             'is_private': 'Private groups require invitation to join',
             'max_members': 'Maximum number of members allowed (2-100)'
         }
+        # UserGroup.name is unique, so the model's validate_unique() checks it
+        error_messages = {
+            'name': {'unique': 'A group with this name already exists.'}
+        }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
         # Set countries queryset - only show countries that have active leagues
         from .models import Country, League, Season
+        league_ids = active_league_ids()
         self.fields['countries'].queryset = Country.objects.filter(
-            leagues__is_active=True
-        ).distinct().order_by('name')
+            pk__in=League.objects.filter(id__in=league_ids).values('country_id')
+        ).only('id', 'name').order_by('name')
+        # League and season labels read the country / league name
+        active_leagues = League.objects.filter(id__in=league_ids).select_related('country')
         
         # Add leagues field (for backward compatibility and mixed selection)
         self.fields['leagues'] = forms.ModelMultipleChoiceField(
@@ -503,7 +633,7 @@ class CreateGroupForm(forms.ModelForm):
         
         # Add round selection fields
         self.fields['round_league'] = forms.ModelChoiceField(
-            queryset=League.objects.filter(is_active=True),
+            queryset=active_leagues,
             required=False,
             widget=forms.Select(attrs={
                 'class': 'form-select',
@@ -515,7 +645,7 @@ class CreateGroupForm(forms.ModelForm):
         )
         
         self.fields['round_season'] = forms.ModelChoiceField(
-            queryset=Season.objects.filter(is_active=True),
+            queryset=Season.objects.filter(is_active=True).select_related('league'),
             required=False,
             widget=forms.Select(attrs={
                 'class': 'form-select',
@@ -550,7 +680,7 @@ class CreateGroupForm(forms.ModelForm):
         )
         
         self.fields['date_leagues'] = forms.ModelMultipleChoiceField(
-            queryset=League.objects.filter(is_active=True),
+            queryset=active_leagues,
             required=False,
             widget=forms.SelectMultiple(attrs={
                 'class': 'form-select',
@@ -561,12 +691,6 @@ class CreateGroupForm(forms.ModelForm):
             help_text='Leave empty to include all active leagues on selected dates'
         )
     
-    def clean_name(self):
-        name = self.cleaned_data.get('name')
-        if name and UserGroup.objects.filter(name=name).exists():
-            raise ValidationError("A group with this name already exists.")
-        return name
-    
     def clean_max_members(self):
         max_members = self.cleaned_data.get('max_members')
         if max_members and (max_members < 2 or max_members > 100):
@@ -582,6 +706,23 @@ class CreateGroupForm(forms.ModelForm):
         round_numbers = cleaned_data.get('round_numbers')
         match_dates = cleaned_data.get('match_dates')
         
+        # Parse the dates and rounds once, only for the selection types that use them;
+        # _save_match_selections reuses the lists
+        match_date_list = []
+        if match_dates and selection_type in ['dates', 'mixed']:
+            from datetime import datetime
+            try:
+                match_date_list = list(dict.fromkeys(
+                    datetime.strptime(date.strip(), '%Y-%m-%d').date() for date in match_dates.split(',')
+                ))
+            except ValueError:
+                raise ValidationError("Please enter dates in YYYY-MM-DD format.")
+        cleaned_data['match_date_list'] = match_date_list
+        round_list = []
+        if round_numbers and selection_type in ['rounds', 'mixed']:
+            round_list = parse_round_numbers(round_numbers)
+        cleaned_data['round_list'] = round_list
+        
         # Validate based on selection type
         if selection_type == 'leagues':
             if not leagues:
@@ -596,14 +737,6 @@ class CreateGroupForm(forms.ModelForm):
         elif selection_type == 'dates':
             if not match_dates:
                 raise ValidationError("Please enter match dates for date-based selection.")
-            # Validate date format
-            try:
-                from datetime import datetime
-                dates = [date.strip() for date in match_dates.split(',')]
-                for date_str in dates:
-                    datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                raise ValidationError("Please enter dates in YYYY-MM-DD format.")
         elif selection_type == 'mixed':
             has_selection = leagues or (round_league and round_season and round_numbers) or match_dates
             if not has_selection:
@@ -622,7 +755,6 @@ class CreateGroupForm(forms.ModelForm):
     def _save_match_selections(self, group):
         """Save the flexible match selections based on form data"""
         from .models import GroupLeagueRound, GroupDateSelection
-        from datetime import datetime
         
         selection_type = self.cleaned_data.get('selection_type')
         all_group_leagues = set()  # Collect all leagues used in this group
@@ -638,51 +770,50 @@ class CreateGroupForm(forms.ModelForm):
         if selection_type in ['rounds', 'mixed']:
             round_league = self.cleaned_data.get('round_league')
             round_season = self.cleaned_data.get('round_season')
-            round_numbers = self.cleaned_data.get('round_numbers')
+            round_list = self.cleaned_data.get('round_list')
             
-            if round_league and round_season and round_numbers:
+            if round_league and round_season and round_list:
                 # Add the round league to the group's leagues
                 all_group_leagues.add(round_league)
                 
-                # Parse round numbers (handle ranges and individual numbers)
-                rounds = []
-                for round_part in round_numbers.split(','):
-                    round_part = round_part.strip()
-                    if '-' in round_part and round_part.replace('-', '').isdigit():
-                        # Handle ranges like "1-5"
-                        start, end = map(int, round_part.split('-'))
-                        rounds.extend([str(i) for i in range(start, end + 1)])
-                    else:
-                        # Handle individual rounds
-                        rounds.append(round_part)
-                
-                # Create GroupLeagueRound objects
-                for round_num in rounds:
-                    GroupLeagueRound.objects.get_or_create(
+                # Create GroupLeagueRound objects; the unique constraint skips existing rounds
+                GroupLeagueRound.objects.bulk_create([
+                    GroupLeagueRound(
                         group=group,
                         league=round_league,
                         season=round_season,
-                        round_number=round_num.strip()
+                        round_number=round_num
                     )
+                    for round_num in round_list
+                ], batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
         
         # Save date selections (for dates and mixed types)
         if selection_type in ['dates', 'mixed']:
-            match_dates = self.cleaned_data.get('match_dates')
+            dates = self.cleaned_data.get('match_date_list')
             date_leagues = self.cleaned_data.get('date_leagues')
             
-            if match_dates:
-                dates = [date.strip() for date in match_dates.split(',')]
-                for date_str in dates:
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    date_selection, created = GroupDateSelection.objects.get_or_create(
-                        group=group,
-                        match_date=date_obj
-                    )
-                    if date_leagues:
-                        date_selection.specific_leagues.set(date_leagues)
-                        all_group_leagues.update(date_leagues)
-                    # If no specific leagues selected for dates, we'll add leagues 
-                    # from matches on those dates later
+            if dates:
+                # The unique constraint skips dates the group already has
+                GroupDateSelection.objects.bulk_create([
+                    GroupDateSelection(group=group, match_date=date_obj) for date_obj in dates
+                ], ignore_conflicts=True)
+                if date_leagues:
+                    # Same as specific_leagues.set(date_leagues) on every selection, in two queries
+                    selection_ids = GroupDateSelection.objects.filter(
+                        group=group, match_date__in=dates
+                    ).values_list('id', flat=True)
+                    SpecificLeagues = GroupDateSelection.specific_leagues.through
+                    SpecificLeagues.objects.filter(groupdateselection_id__in=selection_ids).exclude(
+                        league__in=date_leagues
+                    ).delete()
+                    SpecificLeagues.objects.bulk_create([
+                        SpecificLeagues(groupdateselection_id=selection_id, league_id=league.id)
+                        for selection_id in selection_ids
+                        for league in date_leagues
+                    ], ignore_conflicts=True)
+                    all_group_leagues.update(date_leagues)
+                # If no specific leagues selected for dates, we'll add leagues 
+                # from matches on those dates later
         
         # Update group leagues to include all leagues from all selection types
         if all_group_leagues:
@@ -691,10 +822,8 @@ class CreateGroupForm(forms.ModelForm):
             if selection_type in ['rounds', 'dates']:
                 group.leagues.set(all_group_leagues)
             elif selection_type == 'mixed':
-                # For mixed, add to existing leagues
-                existing_leagues = set(group.leagues.all())
-                existing_leagues.update(all_group_leagues)
-                group.leagues.set(existing_leagues)
+                # For mixed, add to existing leagues; add() only inserts the missing links
+                group.leagues.add(*all_group_leagues)
 
 
 class GroupInvitationForm(forms.ModelForm):
@@ -729,27 +858,28 @@ class GroupInvitationForm(forms.ModelForm):
     def clean_invitee_username(self):
         invitee_username = self.cleaned_data.get('invitee_username')
         if invitee_username:
-            # Try to find user by username or email
-            try:
-                user = User.objects.get(username=invitee_username)
-            except User.DoesNotExist:
-                try:
-                    user = User.objects.get(email=invitee_username)
-                except User.DoesNotExist:
-                    raise ValidationError("User not found. Please check the username or email.")
+            # Try to find user by username or email, preferring a username match
+            user = User.objects.filter(
+                Q(username=invitee_username) | Q(email=invitee_username)
+            ).order_by(
+                Case(When(username=invitee_username, then=0), default=1), 'pk'
+            ).only('id', 'username', 'email').first()
+            if user is None:
+                raise ValidationError("User not found. Please check the username or email.")
             
-            # Check if user is already a member
-            group = self.instance.group if self.instance.pk else None
-            if group and GroupMembership.objects.filter(user=user, group=group).exists():
-                raise ValidationError("This user is already a member of the group.")
-            
-            # Check if there's already a pending invitation
-            if group and GroupInvitation.objects.filter(
-                group=group, 
-                invitee=user, 
-                status='pending'
-            ).exists():
-                raise ValidationError("This user already has a pending invitation to this group.")
+            # Check membership and pending invitations for the group in one query
+            group_id = self.instance.group_id
+            if group_id:
+                existing = UserGroup.objects.filter(pk=group_id).annotate(
+                    has_member=Exists(GroupMembership.objects.filter(user=user, group=OuterRef('pk'))),
+                    has_invite=Exists(GroupInvitation.objects.filter(invitee=user, group=OuterRef('pk'), status='pending')),
+                ).values('has_member', 'has_invite').first() or {}
+                
+                if existing.get('has_member'):
+                    raise ValidationError("This user is already a member of the group.")
+                
+                if existing.get('has_invite'):
+                    raise ValidationError("This user already has a pending invitation to this group.")
             
             return user
         return None
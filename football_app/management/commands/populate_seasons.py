@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 from datetime import date
 from football_app.models import Season
@@ -34,27 +35,39 @@ class Command(BaseCommand):
             {'start_year': 2025, 'end_year': 2026, 'start_date': date(2025, 8, 1), 'end_date': date(2026, 5, 31)},
         ]
         
-        created_count = 0
+        with transaction.atomic():
+            # One query for the seasons that already exist instead of a get_or_create() per season
+            existing_keys = set(Season.objects.filter(
+                start_year__in=[season_data['start_year'] for season_data in seasons_data]
+            ).values_list('start_year', 'end_year'))
+            
+            new_seasons = [
+                Season(
+                    name=f"{season_data['start_year']}/{season_data['end_year']}",
+                    start_year=season_data['start_year'],
+                    end_year=season_data['end_year'],
+                    start_date=season_data['start_date'],
+                    end_date=season_data['end_date'],
+                    is_current=season_data.get('is_current', False),
+                    is_active=True,
+                )
+                for season_data in seasons_data
+                if (season_data['start_year'], season_data['end_year']) not in existing_keys
+            ]
+            
+            # bulk_create() skips Season.save(), which keeps a single current season
+            if any(season.is_current for season in new_seasons):
+                Season.objects.filter(is_current=True).update(is_current=False)
+            Season.objects.bulk_create(new_seasons)
+        
+        created_count = len(new_seasons)
         
         for season_data in seasons_data:
             season_name = f"{season_data['start_year']}/{season_data['end_year']}"
             
-            season, created = Season.objects.get_or_create(
-                start_year=season_data['start_year'],
-                end_year=season_data['end_year'],
-                defaults={
-                    'name': season_name,
-                    'start_date': season_data['start_date'],
-                    'end_date': season_data['end_date'],
-                    'is_current': season_data.get('is_current', False),
-                    'is_active': True,
-                }
-            )
-            
-            if created:
-                created_count += 1
+            if (season_data['start_year'], season_data['end_year']) not in existing_keys:
                 status = "created"
-                if season.is_current:
+                if season_data.get('is_current', False):
                     status += " (CURRENT)"
             else:
                 status = "already exists"
@@ -66,18 +79,21 @@ class Command(BaseCommand):
         )
         
         # Set 2024/2025 as current season if not already set
-        current_season = Season.objects.filter(is_current=True).first()
-        if not current_season:
-            try:
-                season_2024_25 = Season.objects.get(start_year=2024, end_year=2025)
-                season_2024_25.is_current = True
-                season_2024_25.save()
+        # Only the name is reported, so skip loading the whole row
+        current_season_name = Season.objects.filter(is_current=True).values_list('name', flat=True).first()
+        if current_season_name is None:
+            # No season is current, so a plain UPDATE needs no demotion first
+            season_2024_25_id = Season.objects.filter(
+                start_year=2024, end_year=2025
+            ).values_list('pk', flat=True).first()
+            if season_2024_25_id is not None:
+                Season.objects.filter(pk=season_2024_25_id).update(is_current=True)
                 self.stdout.write(
                     self.style.SUCCESS('Set 2024/2025 as the current season.')
                 )
-            except Season.DoesNotExist:
+            else:
                 self.stdout.write(
                     self.style.WARNING('Could not find 2024/2025 season to set as current.')
                 )
         else:
-            self.stdout.write(f'Current season: {current_season.name}')
+            self.stdout.write(f'Current season: {current_season_name}')
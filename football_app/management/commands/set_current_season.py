@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from football_app.models import Season
 
 
@@ -25,12 +26,11 @@ class Command(BaseCommand):
             # Find the season
             season = Season.objects.get(start_year=start_year, end_year=end_year)
             
-            # Set all seasons as not current
-            Season.objects.all().update(is_current=False)
-            
-            # Set the specified season as current
-            season.is_current = True
-            season.save()
+            # Demote the current season(s) and promote this one together, so there
+            # is always exactly one current season; only rows that change are written
+            with transaction.atomic():
+                Season.objects.filter(is_current=True).exclude(pk=season.pk).update(is_current=False)
+                Season.objects.filter(pk=season.pk).update(is_current=True)
             
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully set {season.name} as the current season!')
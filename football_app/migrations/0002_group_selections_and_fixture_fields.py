@@ -0,0 +1,87 @@
+# Generated by Django 4.2.24 on 2026-10-15 09:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='fixture',
+            name='league_external_id',
+        ),
+        migrations.RemoveField(
+            model_name='fixture',
+            name='status',
+        ),
+        migrations.AlterField(
+            model_name='fixture',
+            name='away_team_winner',
+            field=models.BooleanField(blank=True, default=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fixture',
+            name='home_team_winner',
+            field=models.BooleanField(blank=True, default=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fixture',
+            name='round_number',
+            field=models.CharField(blank=True, help_text='Match round/gameweek/stage', null=True),
+        ),
+        migrations.AlterField(
+            model_name='fixture',
+            name='status_long',
+            field=models.CharField(blank=True, choices=[('Time To Be Defined', 'Time To Be Defined'), ('Not Started', 'Not Started'), ('First Half, Kick Off', 'First Half, Kick Off'), ('Halftime', 'Halftime'), ('Second Half, 2nd Half Started', 'Second Half, 2nd Half Started'), ('Extra Time', 'Extra Time'), ('Break Time', 'Break Time'), ('Penalty In Progress', 'Penalty In Progress'), ('Match Suspended', 'Match Suspended'), ('Match Interrupted', 'Match Interrupted'), ('Match Finished', 'Match Finished'), ('Match Finished', 'Match Finished'), ('Match Finished', 'Match Finished'), ('Match Postponed', 'Match Postponed'), ('Match Cancelled', 'Match Cancelled'), ('Match Abandoned', 'Match Abandoned'), ('Technical Loss', 'Technical Loss'), ('WalkOver', 'WalkOver'), ('In Progress', 'In Progress')], max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fixture',
+            name='status_short',
+            field=models.CharField(blank=True, choices=[('TBD', 'TBD'), ('NS', 'NS'), ('1H', '1H'), ('HT', 'HT'), ('2H', '2H'), ('ET', 'ET'), ('BT', 'BT'), ('P', 'P'), ('SUSP', 'SUSP'), ('INT', 'INT'), ('FT', 'FT'), ('AET', 'AET'), ('PEN', 'PEN'), ('PST', 'PST'), ('CANC', 'CANC'), ('ABD', 'ABD'), ('AWD', 'AWD'), ('WO', 'WO'), ('LIVE', 'LIVE')], max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='team',
+            name='code',
+            field=models.CharField(blank=True, max_length=20, null=True),
+        ),
+        migrations.AlterField(
+            model_name='usergroup',
+            name='leagues',
+            field=models.ManyToManyField(blank=True, help_text='Leagues that this group predicts (for backward compatibility)', related_name='prediction_groups', to='football_app.league'),
+        ),
+        migrations.CreateModel(
+            name='GroupLeagueRound',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('round_number', models.CharField(help_text='Round/gameweek number or identifier', max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='group_league_rounds', to='football_app.usergroup')),
+                ('league', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='football_app.league')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='football_app.season')),
+            ],
+            options={
+                'ordering': ['league__name', 'round_number'],
+                'unique_together': {('group', 'league', 'season', 'round_number')},
+            },
+        ),
+        migrations.CreateModel(
+            name='GroupDateSelection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('match_date', models.DateField(help_text='Date to include matches from')),
+                ('description', models.CharField(blank=True, help_text="Optional description for this date selection (e.g., 'Champions League Final')", max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='group_date_selections', to='football_app.usergroup')),
+                ('specific_leagues', models.ManyToManyField(blank=True, help_text='Specific leagues for this date. If empty, includes all active leagues', to='football_app.league')),
+            ],
+            options={
+                'ordering': ['match_date'],
+                'unique_together': {('group', 'match_date')},
+            },
+        ),
+    ]
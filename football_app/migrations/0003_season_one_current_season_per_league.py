@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-15 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football_app', '0002_group_selections_and_fixture_fields'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='season',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('league',), name='one_current_season_per_league'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.24 on 2026-10-15 09:56
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_leagues_count(apps, schema_editor):
+    UserGroup = apps.get_model('football_app', 'UserGroup')
+    league_links = UserGroup.leagues.through.objects.filter(usergroup=models.OuterRef('pk')).order_by().values('usergroup')
+    UserGroup.objects.update(
+        leagues_count=Coalesce(
+            models.Subquery(league_links.annotate(count=models.Count('pk')).values('count')),
+            models.Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football_app', '0003_season_one_current_season_per_league'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usergroup',
+            name='leagues_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of leagues, kept in sync by signals'),
+        ),
+        migrations.RunPython(populate_leagues_count, migrations.RunPython.noop),
+    ]
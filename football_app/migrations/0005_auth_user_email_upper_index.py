@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('football_app', '0004_usergroup_leagues_count'),
+    ]
+
+    operations = [
+        # Matches the UPPER(email) that email__iexact lookups compare on (see UserSignUpForm.clean_email)
+        migrations.RunSQL(
+            'CREATE INDEX auth_user_email_upper_idx ON auth_user (UPPER(email));',
+            'DROP INDEX auth_user_email_upper_idx;',
+        ),
+    ]
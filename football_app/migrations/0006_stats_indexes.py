@@ -0,0 +1,25 @@
+# Generated by Django 4.2.24 on 2026-10-15 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football_app', '0005_auth_user_email_upper_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fixture',
+            index=models.Index(fields=['league', 'date'], name='fixture_league_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fixture',
+            index=models.Index(fields=['status_long', 'date'], name='fixture_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='groupmembership',
+            index=models.Index(fields=['group', '-total_points'], name='membership_leaderboard_idx'),
+        ),
+    ]
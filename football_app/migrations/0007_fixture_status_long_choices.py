@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-15 10:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football_app', '0006_stats_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='fixture',
+            name='status_long',
+            field=models.CharField(blank=True, choices=[('Time To Be Defined', 'Time To Be Defined'), ('Not Started', 'Not Started'), ('First Half, Kick Off', 'First Half, Kick Off'), ('Halftime', 'Halftime'), ('Second Half, 2nd Half Started', 'Second Half, 2nd Half Started'), ('Extra Time', 'Extra Time'), ('Break Time', 'Break Time'), ('Penalty In Progress', 'Penalty In Progress'), ('Match Suspended', 'Match Suspended'), ('Match Interrupted', 'Match Interrupted'), ('Match Finished', 'Match Finished'), ('Match Postponed', 'Match Postponed'), ('Match Cancelled', 'Match Cancelled'), ('Match Abandoned', 'Match Abandoned'), ('Technical Loss', 'Technical Loss'), ('WalkOver', 'WalkOver'), ('In Progress', 'In Progress')], max_length=100, null=True),
+        ),
+    ]
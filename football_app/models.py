@@ -1,7 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import cached_property
+import secrets
+import string
 
 class Country(models.Model):
     """Model representing a country"""
@@ -70,15 +73,27 @@ class Season(models.Model):
     class Meta:
         ordering = ['-start_year']
         unique_together = ['league', 'start_year', 'end_year']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['league'],
+                condition=models.Q(is_current=True),
+                name='one_current_season_per_league'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.league.name})"
 
     def save(self, *args, **kwargs):
-        # Ensure only one season can be current at a time
-        if self.is_current:
-            Season.objects.filter(is_current=True).update(is_current=False)
-        super().save(*args, **kwargs)
+        # Ensure only one season can be current at a time; saves that do not
+        # write is_current cannot break that, so they skip the demotion
+        update_fields = kwargs.get('update_fields')
+        if not self.is_current or (update_fields is not None and 'is_current' not in update_fields):
+            return super().save(*args, **kwargs)
+        with transaction.atomic():
+            # Leave this row alone: saving an already-current season only demotes the others
+            Season.objects.filter(is_current=True).exclude(pk=self.pk).update(is_current=False)
+            super().save(*args, **kwargs)
 
     @classmethod
     def get_current_season(cls, league=None):
@@ -168,8 +183,11 @@ class Fixture(models.Model):
 ]
 
     # Extract choices for status_long and status_short fields
-    STATUS_LONG_CHOICES = [(choice[1], choice[1]) for choice in FIXTURE_STATUS_CHOICES]
+    # FT, AET and PEN share 'Match Finished', which is listed once
+    STATUS_LONG_CHOICES = [(status_long, status_long) for status_long in dict.fromkeys(choice[1] for choice in FIXTURE_STATUS_CHOICES)]
     STATUS_SHORT_CHOICES = [(choice[0], choice[0]) for choice in FIXTURE_STATUS_CHOICES]
+    # status_long values that no longer accept predictions
+    FINISHED_OR_LIVE_STATUSES = frozenset(['Match Finished', 'In Progress', 'First Half, Kick Off', 'Second Half, 2nd Half Started', 'Extra Time', 'Penalty In Progress'])
 
     date = models.DateTimeField()
     referee = models.CharField(max_length=100, blank=True, null=True)
@@ -209,6 +227,11 @@ class Fixture(models.Model):
     class Meta:
         ordering = ['-date']
         unique_together = ['home_team', 'away_team', 'date', 'season']
+        indexes = [
+            # League fixture lists and upcoming/finished match queries, ordered by date
+            models.Index(fields=['league', 'date'], name='fixture_league_date_idx'),
+            models.Index(fields=['status_long', 'date'], name='fixture_status_date_idx'),
+        ]
 
     def __str__(self):
         if self.home_goals is not None and self.away_goals is not None:
@@ -235,6 +258,20 @@ class Fixture(models.Model):
         else:
             return 'D'
 
+    @staticmethod
+    def result_expression(prefix=''):
+        """Database-side equivalent of `result`, for annotating querysets (prefix e.g. 'match__')"""
+        finished = models.Q(**{f'{prefix}status_long': 'Match Finished'})
+        home_goals = models.F(f'{prefix}home_goals')
+        away_goals = models.F(f'{prefix}away_goals')
+        return models.Case(
+            models.When(finished & models.Q(**{f'{prefix}home_goals__gt': away_goals}), then=models.Value('H')),
+            models.When(finished & models.Q(**{f'{prefix}away_goals__gt': home_goals}), then=models.Value('A')),
+            models.When(finished & models.Q(**{f'{prefix}home_goals': away_goals}), then=models.Value('D')),
+            default=None,
+            output_field=models.CharField(max_length=1)
+        )
+
 
 class MatchPredict(models.Model):
     """Model representing a user's prediction for a match"""
@@ -265,9 +302,17 @@ class MatchPredict(models.Model):
         return f"{self.user.username} predicts {self.match}"
 
     def save(self, *args, **kwargs):
-        # Prevent predictions on finished or live matches
-        if self.match.status_long in ['Match Finished', 'In Progress', 'First Half, Kick Off', 'Second Half, 2nd Half Started', 'Extra Time', 'Penalty In Progress'] and not self.pk:
-            raise ValueError("Cannot create predictions for finished or live matches")
+        # Prevent predictions on finished or live matches; only new predictions are
+        # checked, against the loaded match if any, else with a narrow status probe
+        if not self.pk:
+            if MatchPredict.match.is_cached(self):
+                match_closed = self.match.status_long in Fixture.FINISHED_OR_LIVE_STATUSES
+            else:
+                match_closed = Fixture.objects.filter(
+                    pk=self.match_id, status_long__in=Fixture.FINISHED_OR_LIVE_STATUSES
+                ).exists()
+            if match_closed:
+                raise ValueError("Cannot create predictions for finished or live matches")
         super().save(*args, **kwargs)
 
     @property
@@ -278,7 +323,7 @@ class MatchPredict(models.Model):
         return self.predicted_result == self.match.result
 
     def calculate_points(self):
-        """Calculate points based on prediction accuracy"""
+        """Calculate points based on prediction accuracy (see bulk_calculate_points for many rows)"""
         if not self.match.is_finished:
             return 0
         
@@ -299,6 +344,58 @@ class MatchPredict(models.Model):
         self.save()
         return points
 
+    @staticmethod
+    def stats_aggregates():
+        """Aggregates for a prediction queryset: totals, correct/exact counts and stored points"""
+        exact = models.Q(
+            predicted_home_score=models.F('match__home_goals'),
+            predicted_away_score=models.F('match__away_goals')
+        )
+        correct = models.Q(predicted_result=Fixture.result_expression('match__'))
+        return {
+            'total': models.Count('id'),
+            'correct': models.Count('id', filter=correct),
+            'exact': models.Count('id', filter=exact),
+            'correct_not_exact': models.Count('id', filter=correct & ~exact),
+            'points': models.Sum('points_earned'),
+        }
+
+    @staticmethod
+    def points_expression():
+        """Database-side equivalent of calculate_points(), for annotating querysets"""
+        exact = models.Q(
+            match__status_long='Match Finished',
+            predicted_home_score=models.F('match__home_goals'),
+            predicted_away_score=models.F('match__away_goals')
+        )
+        correct = models.Q(predicted_result=Fixture.result_expression('match__'))
+        return models.Case(
+            models.When(exact, then=models.Value(5)),
+            models.When(correct, then=models.Value(2)),
+            default=models.Value(0),
+            output_field=models.PositiveIntegerField()
+        )
+
+    @classmethod
+    def bulk_calculate_points(cls, predictions):
+        """Recalculate points for a prediction queryset in the database; returns (updated, total)"""
+        rows = predictions.annotate(new_points=cls.points_expression()).values_list(
+            'pk', 'points_earned', 'new_points'
+        )
+        total = 0
+        changed = []
+        for pk, points_earned, new_points in rows.iterator(chunk_size=2000):
+            total += 1
+            # Only write rows whose points actually change
+            if new_points != points_earned:
+                changed.append(cls(pk=pk, points_earned=new_points))
+        cls.objects.bulk_update(changed, ['points_earned'], batch_size=500)
+        return len(changed), total
+
+
+# Characters of generated group join codes
+JOIN_CODE_ALPHABET = string.ascii_uppercase + string.digits
+
 
 class UserGroup(models.Model):
     """Model representing a prediction group where users compete"""
@@ -308,6 +405,8 @@ class UserGroup(models.Model):
     members = models.ManyToManyField(User, through='GroupMembership', related_name='joined_groups')
     leagues = models.ManyToManyField(League, related_name='prediction_groups', blank=True,
                                    help_text="Leagues that this group predicts (for backward compatibility)")
+    leagues_count = models.PositiveIntegerField(default=0, editable=False,
+                                              help_text="Number of leagues, kept in sync by signals")
     is_private = models.BooleanField(default=False, help_text="Private groups require invitation")
     max_members = models.PositiveIntegerField(default=50, help_text="Maximum number of members")
     join_code = models.CharField(max_length=20, unique=True, blank=True, 
@@ -324,71 +423,95 @@ class UserGroup(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.join_code:
-            import secrets
-            import string
-            self.join_code = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(8))
+            self.join_code = ''.join(secrets.choice(JOIN_CODE_ALPHABET) for _ in range(8))
         super().save(*args, **kwargs)
 
-    @property
+    @cached_property
     def member_count(self):
+        # Group lists annotate member_count, which skips this query per group
         return self.members.count()
 
     def can_join(self, user):
         """Check if a user can join this group"""
-        if self.member_count >= self.max_members:
+        # Member count and the user's membership in one query instead of loading every member
+        counts = self.groupmembership_set.aggregate(
+            members=models.Count('pk'),
+            is_member=models.Count('pk', filter=models.Q(user=user.pk))
+        )
+        if counts['members'] >= self.max_members:
             return False, "Group is full"
-        if user in self.members.all():
+        if counts['is_member']:
             return False, "Already a member"
         return True, "Can join"
 
+    @classmethod
+    def refresh_leagues_count(cls, group_ids):
+        """Recount leagues for the given groups in a single UPDATE"""
+        league_links = cls.leagues.through.objects.filter(usergroup=models.OuterRef('pk')).order_by().values('usergroup')
+        cls.objects.filter(pk__in=group_ids).update(
+            leagues_count=models.functions.Coalesce(
+                models.Subquery(league_links.annotate(count=models.Count('pk')).values('count')),
+                models.Value(0)
+            )
+        )
+
     def get_leaderboard(self):
-        """Get group leaderboard sorted by total points"""
-        memberships = self.groupmembership_set.select_related('user').order_by('-total_points')
+        """Get group leaderboard sorted by total points
+        
+        Leaderboard rows render the member's username and profile avatar, so
+        both are joined here.
+        """
+        memberships = self.groupmembership_set.select_related('user', 'user__profile').order_by('-total_points')
         return memberships
 
     def get_all_matches(self):
         """Get all matches that belong to this group based on all selection criteria"""
         from django.db.models import Q
         
-        # Start with empty queryset
-        all_matches = Fixture.objects.none()
+        # Each selection contributes one condition; the group covers any fixture matching one of them
+        conditions = []
         
         # Add matches from entire leagues (backward compatibility)
         if self.leagues.exists():
-            league_matches = Fixture.objects.filter(league__in=self.leagues.all())
-            all_matches = all_matches.union(league_matches)
+            conditions.append(Q(league__in=self.leagues.all()))
         
         # Add matches from league rounds
         for league_round in self.group_league_rounds.all():
-            round_matches = Fixture.objects.filter(
-                league=league_round.league,
-                season=league_round.season,
+            conditions.append(Q(
+                league=league_round.league_id,
+                season=league_round.season_id,
                 round_number=league_round.round_number
-            )
-            all_matches = all_matches.union(round_matches)
+            ))
         
         # Add matches from specific dates
-        for date_selection in self.group_date_selections.all():
-            if date_selection.specific_leagues.exists():
+        current_season = None
+        for date_selection in self.group_date_selections.prefetch_related('specific_leagues'):
+            specific_leagues = list(date_selection.specific_leagues.all())
+            if specific_leagues:
                 # Matches from specific leagues on specific date
-                date_matches = Fixture.objects.filter(
-                    league__in=date_selection.specific_leagues.all(),
+                conditions.append(Q(
+                    league__in=specific_leagues,
                     date__date=date_selection.match_date
-                )
+                ))
             else:
                 # All matches from active leagues on specific date
-                current_season = Season.get_current_season()
+                if current_season is None:
+                    current_season = Season.get_current_season()
                 if current_season:
-                    date_matches = Fixture.objects.filter(
+                    conditions.append(Q(
                         season=current_season,
                         league__is_active=True,
                         date__date=date_selection.match_date
-                    )
-                else:
-                    date_matches = Fixture.objects.none()
-            all_matches = all_matches.union(date_matches)
+                    ))
         
-        return all_matches.distinct()
+        if not conditions:
+            return Fixture.objects.none()
+        
+        # A single OR'ed filter instead of union(): the result can still be filtered, sliced and made distinct
+        matches_filter = conditions[0]
+        for condition in conditions[1:]:
+            matches_filter |= condition
+        return Fixture.objects.filter(matches_filter).distinct()
 
     def get_all_leagues(self):
         """Get all leagues involved in this group from all selection types"""
@@ -477,18 +600,22 @@ class GroupMembership(models.Model):
     class Meta:
         unique_together = ['user', 'group']
         ordering = ['-total_points', '-joined_at']
+        indexes = [
+            # Group leaderboards
+            models.Index(fields=['group', '-total_points'], name='membership_leaderboard_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} in {self.group.name}"
 
-    @property
+    @cached_property
     def accuracy_percentage(self):
         """Calculate prediction accuracy percentage"""
         if self.total_predictions == 0:
             return 0
         return round((self.correct_predictions / self.total_predictions) * 100, 2)
 
-    @property
+    @cached_property
     def exact_score_percentage(self):
         """Calculate exact score prediction percentage"""
         if self.total_predictions == 0:
@@ -499,35 +626,52 @@ class GroupMembership(models.Model):
         """Update member statistics for this group"""
         # Get all predictions for matches in this group using the new flexible system
         group_matches = self.group.get_all_matches()
-        predictions = MatchPredict.objects.filter(
-            user=self.user,
+        stats = MatchPredict.objects.filter(
+            user=self.user_id,
             match__in=group_matches,
             match__status_long='Match Finished'
-        )
-        
-        self.total_predictions = predictions.count()
-        # Calculate correct predictions manually since result is a property
-        correct_count = 0
-        for prediction in predictions:
-            if prediction.is_correct:
-                correct_count += 1
-        self.correct_predictions = correct_count
-        
-        # Count exact score predictions
-        exact_predictions = 0
-        total_points = 0
+        ).aggregate(**MatchPredict.stats_aggregates())
+        self._apply_stats(stats)
+        self.save(update_fields=self.STATS_FIELDS)
+
+    def _apply_stats(self, stats):
+        self.total_predictions = stats['total']
+        self.correct_predictions = stats['correct']
+        self.exact_predictions = stats['exact']
+        # 5 points for exact score, 2 points for correct outcome
+        self.total_points = 5 * stats['exact'] + 2 * stats['correct_not_exact']
+        self.__dict__.pop('accuracy_percentage', None)
+        self.__dict__.pop('exact_score_percentage', None)
+
+    STATS_FIELDS = ['total_points', 'total_predictions', 'correct_predictions', 'exact_predictions']
+
+    @classmethod
+    def bulk_update_stats(cls, memberships):
+        """Recompute statistics for many memberships with one aggregate query per group"""
+        memberships = list(memberships)
+        by_group = {}
+        for membership in memberships:
+            by_group.setdefault(membership.group_id, []).append(membership)
         
-        for prediction in predictions:
-            if (prediction.predicted_home_score == prediction.match.home_goals and 
-                prediction.predicted_away_score == prediction.match.away_goals):
-                exact_predictions += 1
-                total_points += 5  # 5 points for exact score
-            elif prediction.is_correct:
-                total_points += 2  # 2 points for correct outcome
+        empty = dict.fromkeys(('total', 'correct', 'exact', 'correct_not_exact'), 0)
+        changed = []
+        for group_memberships in by_group.values():
+            group = group_memberships[0].group
+            rows = MatchPredict.objects.filter(
+                user__in=[membership.user_id for membership in group_memberships],
+                match__in=group.get_all_matches(),
+                match__status_long='Match Finished'
+            ).values('user').annotate(**MatchPredict.stats_aggregates())
+            stats_by_user = {row['user']: row for row in rows}
+            for membership in group_memberships:
+                previous = [getattr(membership, field) for field in cls.STATS_FIELDS]
+                membership._apply_stats(stats_by_user.get(membership.user_id, empty))
+                if [getattr(membership, field) for field in cls.STATS_FIELDS] != previous:
+                    changed.append(membership)
         
-        self.exact_predictions = exact_predictions
-        self.total_points = total_points
-        self.save()
+        # Rows whose statistics did not move are not written
+        cls.objects.bulk_update(changed, cls.STATS_FIELDS, batch_size=500)
+        return len(memberships)
 
 
 class GroupInvitation(models.Model):
@@ -554,25 +698,26 @@ class GroupInvitation(models.Model):
     def __str__(self):
         return f"Invitation to {self.invitee.username} for {self.group.name}"
 
-    @property
+    @cached_property
     def is_expired(self):
         """Check if invitation is expired (30 days)"""
-        from django.utils import timezone
-        from datetime import timedelta
         return timezone.now() > self.created_at + timedelta(days=30)
 
     def accept(self):
         """Accept the invitation"""
         if self.status == 'pending' and not self.is_expired:
-            can_join, message = self.group.can_join(self.invitee)
-            if can_join:
-                GroupMembership.objects.create(user=self.invitee, group=self.group)
-                self.status = 'accepted'
-                self.responded_at = timezone.now()
-                self.save()
-                return True, "Invitation accepted"
-            else:
-                return False, message
+            with transaction.atomic():
+                # Lock the group row so concurrent accepts cannot overfill the group
+                group = self.group = UserGroup.objects.select_for_update().get(pk=self.group_id)
+                can_join, message = group.can_join(self.invitee)
+                if can_join:
+                    GroupMembership.objects.create(user=self.invitee, group=group)
+                    self.status = 'accepted'
+                    self.responded_at = timezone.now()
+                    self.save(update_fields=['status', 'responded_at'])
+                    return True, "Invitation accepted"
+                else:
+                    return False, message
         return False, "Invitation cannot be accepted"
 
     def decline(self):
@@ -611,8 +756,10 @@ class UserProfile(models.Model):
             today = date.today()
             self.age = today.year - self.birthday.year - ((today.month, today.day) < (self.birthday.month, self.birthday.day))
         super().save(*args, **kwargs)
+        # The names may have been edited since full_name was cached
+        self.__dict__.pop('full_name', None)
 
-    @property
+    @cached_property
     def full_name(self):
         """Return the full name of the user"""
         if self.first_name and self.last_name:
@@ -623,7 +770,7 @@ class UserProfile(models.Model):
             return self.last_name
         return self.user.username
 
-    @property
+    @cached_property
     def accuracy_percentage(self):
         """Calculate prediction accuracy percentage"""
         if self.total_predictions == 0:
@@ -632,13 +779,38 @@ class UserProfile(models.Model):
 
     def update_stats(self):
         """Update user statistics based on predictions"""
-        predictions = MatchPredict.objects.filter(user=self.user, match__status_long='finished')
-        self.total_predictions = predictions.count()
-        # Calculate correct predictions manually since result is a property
-        correct_count = 0
-        for prediction in predictions:
-            if prediction.is_correct:
-                correct_count += 1
-        self.correct_predictions = correct_count
-        self.total_points = sum(prediction.points_earned for prediction in predictions)
-        self.save()
+        stats = MatchPredict.objects.filter(
+            user=self.user_id, match__status_long='Match Finished'
+        ).aggregate(**MatchPredict.stats_aggregates())
+        self._apply_stats(stats)
+        self.save(update_fields=self.STATS_FIELDS)
+
+    def _apply_stats(self, stats):
+        self.total_predictions = stats['total']
+        self.correct_predictions = stats['correct']
+        self.total_points = stats['points'] or 0
+        self.__dict__.pop('accuracy_percentage', None)
+
+    STATS_FIELDS = ['total_points', 'total_predictions', 'correct_predictions']
+
+    @classmethod
+    def bulk_update_stats(cls, profiles):
+        """Recompute statistics for many profiles with a single aggregate query"""
+        profiles = list(profiles)
+        rows = MatchPredict.objects.filter(
+            user__in=[profile.user_id for profile in profiles],
+            match__status_long='Match Finished'
+        ).values('user').annotate(**MatchPredict.stats_aggregates())
+        stats_by_user = {row['user']: row for row in rows}
+        
+        empty = {'total': 0, 'correct': 0, 'points': 0}
+        changed = []
+        for profile in profiles:
+            previous = [getattr(profile, field) for field in cls.STATS_FIELDS]
+            profile._apply_stats(stats_by_user.get(profile.user_id, empty))
+            if [getattr(profile, field) for field in cls.STATS_FIELDS] != previous:
+                changed.append(profile)
+        
+        # Rows whose statistics did not move are not written
+        cls.objects.bulk_update(changed, cls.STATS_FIELDS, batch_size=500)
+        return len(profiles)
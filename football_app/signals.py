@@ -0,0 +1,61 @@
+from uuid import uuid4
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from .models import Country, League, Season, UserGroup, Fixture, MatchPredict, GroupMembership
+
+# Cache keys for the admin list filter choices (see admin.ActiveLeagueFilter)
+ACTIVE_LEAGUES_LOOKUP_CACHE_KEY = 'admin:active_leagues_lookup'
+ACTIVE_LEAGUE_SEASONS_LOOKUP_CACHE_KEY = 'admin:active_league_seasons_lookup'
+# Ids of active leagues for the group creation form (see forms.active_league_ids)
+ACTIVE_LEAGUE_IDS_CACHE_KEY = 'forms:active_league_ids'
+# Per-model token that is part of every cached changelist count (see admin.CachedCountPaginator)
+ADMIN_COUNT_VERSION_CACHE_KEY = 'admin:count_version:{}'
+
+
+@receiver([post_save, post_delete], sender=Country)
+@receiver([post_save, post_delete], sender=League)
+def invalidate_league_lookups(sender, **kwargs):
+    """League names and active flags feed both admin filters and the group form"""
+    cache.delete_many([ACTIVE_LEAGUES_LOOKUP_CACHE_KEY, ACTIVE_LEAGUE_SEASONS_LOOKUP_CACHE_KEY, ACTIVE_LEAGUE_IDS_CACHE_KEY])
+
+
+@receiver([post_save, post_delete], sender=Season)
+def invalidate_season_lookups(sender, **kwargs):
+    cache.delete(ACTIVE_LEAGUE_SEASONS_LOOKUP_CACHE_KEY)
+
+
+@receiver(m2m_changed, sender=UserGroup.leagues.through)
+def update_group_leagues_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep UserGroup.leagues_count in step with group.leagues / league.prediction_groups"""
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            # Update the instance too, so a later save() does not write back a stale count
+            instance.leagues_count = instance.leagues.count()
+            UserGroup.objects.filter(pk=instance.pk).update(leagues_count=instance.leagues_count)
+    elif action == 'pre_clear':
+        # pk_set is None on clear, so remember the affected groups before the rows go
+        instance._cleared_group_ids = list(instance.prediction_groups.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        UserGroup.refresh_leagues_count(instance.__dict__.pop('_cleared_group_ids', []))
+    elif action in ('post_add', 'post_remove'):
+        UserGroup.refresh_leagues_count(pk_set)
+
+
+@receiver(pre_delete, sender=League)
+def remember_league_groups(sender, instance, **kwargs):
+    # Cascade deletes of the link rows do not send m2m_changed
+    instance._group_ids = list(instance.prediction_groups.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=League)
+def update_deleted_league_groups(sender, instance, **kwargs):
+    UserGroup.refresh_leagues_count(instance.__dict__.pop('_group_ids', []))
+
+
+@receiver([post_save, post_delete], sender=Fixture)
+@receiver([post_save, post_delete], sender=MatchPredict)
+@receiver([post_save, post_delete], sender=GroupMembership)
+def invalidate_admin_counts(sender, **kwargs):
+    """A new token orphans every cached count for the model; they expire on their own"""
+    cache.set(ADMIN_COUNT_VERSION_CACHE_KEY.format(sender._meta.label_lower), uuid4().hex, None)
@@ -2,25 +2,27 @@ from django import template
 
 register = template.Library()
 
+# Display order of knockout rounds, built once instead of on every render
+ROUND_ORDER = (
+    'Preliminary round',
+    '1st Qualifying Round',
+    '2nd Qualifying Round',
+    '3rd Qualifying Round',
+    'Play-offs',
+    'Round of 16',
+    'Quarter-finals',
+    'Semi-finals',
+    'Final',
+)
+ROUND_ORDER_MAP = {round_name: index for index, round_name in enumerate(ROUND_ORDER)}
+ROUND_ORDER_LOWER = tuple(round_name.lower() for round_name in ROUND_ORDER)
+ROUND_ORDER_MAP_LOWER = {round_name: index for index, round_name in enumerate(ROUND_ORDER_LOWER)}
+EXPANDED_ROUNDS = frozenset(['Round of 16', 'Quarter-finals', 'Semi-finals', 'Final'])
+
 @register.filter
 def lookup_dict(form, match_id):
     """Helper filter to access dynamic form fields in bulk prediction form"""
-    field_data = {}
-    field_prefix = f'match_{match_id}'
-    
-    # Get the form fields for this match
-    result_field = form.fields.get(f'{field_prefix}_result')
-    home_score_field = form.fields.get(f'{field_prefix}_home_score')
-    away_score_field = form.fields.get(f'{field_prefix}_away_score')
-    
-    if result_field:
-        field_data['result'] = form[f'{field_prefix}_result']
-    if home_score_field:
-        field_data['home_score'] = form[f'{field_prefix}_home_score']
-    if away_score_field:
-        field_data['away_score'] = form[f'{field_prefix}_away_score']
-    
-    return field_data
+    return form.get_match_fields(match_id)
 
 @register.filter
 def lookup(dictionary, key):
@@ -30,72 +32,38 @@ def lookup(dictionary, key):
 @register.filter
 def sort_rounds_by_order(rounds_dict):
     """Sort rounds dictionary by predefined order"""
-    # Define the order for round numbers
-    round_order = [
-        'Preliminary round',
-        '1st Qualifying Round',
-        '2nd Qualifying Round', 
-        '3rd Qualifying Round',
-        'Play-offs',
-        'Round of 16',
-        'Quarter-finals',
-        'Semi-finals',
-        'Final'
-    ]
-    
-    # Create a mapping of round names to their order
-    order_map = {round_name: index for index, round_name in enumerate(round_order)}
-    
     # Sort the dictionary items by the predefined order
-    sorted_items = sorted(rounds_dict.items(), key=lambda x: order_map.get(x[0], 999))
+    sorted_items = sorted(rounds_dict.items(), key=lambda x: ROUND_ORDER_MAP.get(x[0], 999))
     
     return dict(sorted_items)
 
-@register.filter
-def sort_round_numbers_by_order(rounds_dict):
-    """Sort round numbers within a round type by predefined order"""
-    # Define the order for round numbers
-    round_order = [
-        'Preliminary round',
-        '1st Qualifying Round',
-        '2nd Qualifying Round', 
-        '3rd Qualifying Round',
-        'Play-offs',
-        'Round of 16',
-        'Quarter-finals',
-        'Semi-finals',
-        'Final'
-    ]
+def _round_order_key(round_name):
+    # Try exact match first
+    if round_name in ROUND_ORDER_MAP:
+        return ROUND_ORDER_MAP[round_name]
     
-    # Create a mapping of round names to their order
-    order_map = {round_name: index for index, round_name in enumerate(round_order)}
+    # Try case-insensitive match
+    round_name_lower = round_name.lower()
+    if round_name_lower in ROUND_ORDER_MAP_LOWER:
+        return ROUND_ORDER_MAP_LOWER[round_name_lower]
     
-    # Also handle variations and partial matches
-    def get_order_key(round_name):
-        # Try exact match first
-        if round_name in order_map:
-            return order_map[round_name]
-        
-        # Try case-insensitive match
-        for ordered_round in round_order:
-            if round_name.lower() == ordered_round.lower():
-                return order_map[ordered_round]
-        
-        # Try partial match
-        for ordered_round in round_order:
-            if ordered_round.lower() in round_name.lower() or round_name.lower() in ordered_round.lower():
-                return order_map[ordered_round]
-        
-        # Default to end for unknown rounds
-        return 999
+    # Try partial match
+    for index, ordered_round_lower in enumerate(ROUND_ORDER_LOWER):
+        if ordered_round_lower in round_name_lower or round_name_lower in ordered_round_lower:
+            return index
     
-    # Sort the dictionary items by the predefined order
-    sorted_items = sorted(rounds_dict.items(), key=lambda x: get_order_key(x[0]))
+    # Default to end for unknown rounds
+    return 999
+
+@register.filter
+def sort_round_numbers_by_order(rounds_dict):
+    """Sort round numbers within a round type by predefined order"""
+    # Also handles case variations and partial matches of the round names
+    sorted_items = sorted(rounds_dict.items(), key=lambda x: _round_order_key(x[0]))
     
     return dict(sorted_items)
 
 @register.filter
 def should_expand_round(round_name):
     """Check if a round should be expanded by default"""
-    expanded_rounds = ['Round of 16', 'Quarter-finals', 'Semi-finals', 'Final']
-    return round_name in expanded_rounds
+    return round_name in EXPANDED_ROUNDS
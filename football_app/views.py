@@ -3,6 +3,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
+from django.db import IntegrityError, transaction
 from django.db.models import Count, Q, Avg, Sum, F
 from django.utils import timezone
 from datetime import timedelta
@@ -176,86 +177,52 @@ def league_detail(request, league_id):
     # Calculate standings for Regular Season and Group% round_types
     def calculate_standings_for_round_type(round_type):
         """Calculate standings for a specific round type"""
-        team_ids = set()
-        team_ids.update(Fixture.objects.filter(
-            league=league, 
-            season=selected_season, 
-            round_type=round_type
-        ).values_list('home_team_id', flat=True))
-        team_ids.update(Fixture.objects.filter(
+        round_fixtures = Fixture.objects.filter(
             league=league, 
             season=selected_season, 
             round_type=round_type
-        ).values_list('away_team_id', flat=True))
+        )
+        team_ids = set()
+        for home_team_id, away_team_id in round_fixtures.values_list('home_team_id', 'away_team_id'):
+            team_ids.add(home_team_id)
+            team_ids.add(away_team_id)
         teams = Team.objects.filter(id__in=team_ids)
+        
+        # Finished results as plain (goals for, goals against) tuples per team, newest
+        # first, read in one pass instead of loading full fixtures for every team
+        team_results = {team_id: [] for team_id in team_ids}
+        finished_results = round_fixtures.filter(
+            status_long='Match Finished'
+        ).order_by('-date').values_list('home_team_id', 'away_team_id', 'home_goals', 'away_goals')
+        for home_team_id, away_team_id, home_goals, away_goals in finished_results.iterator():
+            team_results[home_team_id].append((home_goals, away_goals))
+            team_results[away_team_id].append((away_goals, home_goals))
+        
         standings = []
         
         for team in teams:
-            # Get finished matches for this team in the selected season and round type
-            home_matches = Fixture.objects.filter(
-                home_team=team, 
-                league=league, 
-                season=selected_season, 
-                status_long='Match Finished',
-                round_type=round_type
-            )
-            away_matches = Fixture.objects.filter(
-                away_team=team, 
-                league=league, 
-                season=selected_season, 
-                status_long='Match Finished',
-                round_type=round_type
-            )
+            results = team_results[team.id]
             
-            played = home_matches.count() + away_matches.count()
-            wins = (home_matches.filter(home_goals__gt=F('away_goals')).count() + 
-                    away_matches.filter(away_goals__gt=F('home_goals')).count())
-            draws = (home_matches.filter(home_goals=F('away_goals')).count() + 
-                     away_matches.filter(away_goals=F('home_goals')).count())
+            played = len(results)
+            wins = sum(1 for scored, conceded in results if scored is not None and conceded is not None and scored > conceded)
+            draws = sum(1 for scored, conceded in results if scored is not None and scored == conceded)
             losses = played - wins - draws
             
-            # Calculate goals manually to avoid CombinedExpression issues
-            goals_for = 0
-            goals_against = 0
-            
-            # Home matches - team's goals are home_goals
-            for match in home_matches:
-                if match.home_goals is not None:
-                    goals_for += match.home_goals
-                if match.away_goals is not None:
-                    goals_against += match.away_goals
-            
-            # Away matches - team's goals are away_goals
-            for match in away_matches:
-                if match.away_goals is not None:
-                    goals_for += match.away_goals
-                if match.home_goals is not None:
-                    goals_against += match.home_goals
+            goals_for = sum(scored for scored, conceded in results if scored is not None)
+            goals_against = sum(conceded for scored, conceded in results if conceded is not None)
             
             goal_difference = goals_for - goals_against
             points = wins * 3 + draws
             
             # Calculate recent form (last 5 matches)
-            all_team_matches = list(home_matches) + list(away_matches)
-            all_team_matches.sort(key=lambda x: x.date, reverse=True)
-            last_5_matches = all_team_matches[:5]
-            
             form = []
-            for match in last_5_matches:
-                if match.home_team == team:
-                    if match.home_goals > match.away_goals:
-                        form.append('W')
-                    elif match.home_goals < match.away_goals:
-                        form.append('L')
-                    else:
-                        form.append('D')
-                else:  # away match
-                    if match.away_goals > match.home_goals:
-                        form.append('W')
-                    elif match.away_goals < match.home_goals:
-                        form.append('L')
-                    else:
-                        form.append('D')
+            for scored, conceded in results[:5]:
+                if scored > conceded:
+                    form.append('W')
+                elif scored < conceded:
+                    form.append('L')
+                else:
+                    form.append('D')
             
             standings.append({
                 'team': team,
@@ -586,19 +553,19 @@ def team_detail(request, team_id):
     goals_for = 0
     goals_against = 0
     
-    # Home matches - team's goals are home_goals
-    for match in finished_home_matches:
-        if match.home_goals is not None:
-            goals_for += match.home_goals
-        if match.away_goals is not None:
-            goals_against += match.away_goals
+    # Home matches - team's goals are home_goals (only the two score columns are read)
+    for home_goals, away_goals in finished_home_matches.values_list('home_goals', 'away_goals'):
+        if home_goals is not None:
+            goals_for += home_goals
+        if away_goals is not None:
+            goals_against += away_goals
     
     # Away matches - team's goals are away_goals
-    for match in finished_away_matches:
-        if match.away_goals is not None:
-            goals_for += match.away_goals
-        if match.home_goals is not None:
-            goals_against += match.home_goals
+    for home_goals, away_goals in finished_away_matches.values_list('home_goals', 'away_goals'):
+        if away_goals is not None:
+            goals_for += away_goals
+        if home_goals is not None:
+            goals_against += home_goals
     
     goal_difference = goals_for - goals_against
     points = total_wins * 3 + total_draws
@@ -607,7 +574,8 @@ def team_detail(request, team_id):
     recent_matches = [match for match in all_matches if match.status_long == 'Match Finished'][:10]
     
     # Get upcoming matches
-    upcoming_matches = [match for match in all_matches if match.status_long == 'Not Started' and match.date >= timezone.now()][:10]
+    now = timezone.now()
+    upcoming_matches = [match for match in all_matches if match.status_long == 'Not Started' and match.date >= now][:10]
     
     # Calculate form (last 5 matches)
     last_5_matches = recent_matches[:5]
@@ -695,27 +663,21 @@ def user_detail(request, user_id):
         user=user, is_active=True
     ).select_related('group').order_by('-total_points')
     
-    # Statistics by league
+    # Statistics by league, aggregated in the database instead of per prediction
+    league_rows = list(MatchPredict.objects.filter(
+        user=user, match__status_long='Match Finished'
+    ).values('match__league').annotate(**MatchPredict.stats_aggregates()).order_by('match__league__name'))
+    leagues_by_id = League.objects.select_related('country').in_bulk(
+        [row['match__league'] for row in league_rows if row['match__league'] is not None]
+    )
     league_stats = {}
-    for prediction in MatchPredict.objects.filter(user=user, match__status_long='Match Finished'):
-        league = prediction.match.league
-        if league not in league_stats:
-            league_stats[league] = {
-                'total': 0,
-                'correct': 0,
-                'exact': 0,
-                'points': 0
-            }
-        
-        league_stats[league]['total'] += 1
-        league_stats[league]['points'] += prediction.points_earned
-        
-        if prediction.is_correct:
-            league_stats[league]['correct'] += 1
-        
-        if (prediction.predicted_home_score == prediction.match.home_goals and 
-            prediction.predicted_away_score == prediction.match.away_goals):
-            league_stats[league]['exact'] += 1
+    for row in league_rows:
+        league_stats[leagues_by_id.get(row['match__league'])] = {
+            'total': row['total'],
+            'correct': row['correct'],
+            'exact': row['exact'],
+            'points': row['points'] or 0
+        }
     
     # Calculate accuracy for each league
     for league, stats in league_stats.items():
@@ -749,7 +711,9 @@ def group_list(request):
     """List all public user groups"""
     groups = UserGroup.objects.filter(
         is_active=True, is_private=False
-    ).prefetch_related('members', 'leagues').order_by('-created_at')
+    ).annotate(
+        member_count=Count('groupmembership')
+    ).select_related('creator').prefetch_related('leagues').order_by('-created_at')
     
     context = {
         'groups': groups,
@@ -771,19 +735,19 @@ def group_detail(request, group_id):
         except GroupMembership.DoesNotExist:
             pass
     
-    # Get leaderboard
-    leaderboard = GroupMembership.objects.filter(
-        group=group, is_active=True
-    ).select_related('user').order_by('-total_points', '-correct_predictions')
-    
-    # Update stats for all members (this could be optimized with background tasks)
-    for membership in leaderboard:
-        membership.update_stats()
+    # Update stats for all members in one aggregate query (this could be optimized with background tasks)
+    GroupMembership.bulk_update_stats(
+        GroupMembership.objects.filter(group=group, is_active=True).select_related('group')
+    )
     
-    # Refresh leaderboard after stats update
+    # Get leaderboard after stats update
     leaderboard = GroupMembership.objects.filter(
         group=group, is_active=True
-    ).select_related('user').order_by('-total_points', '-correct_predictions')
+    ).select_related('user', 'user__profile').only(
+        # Just the columns the leaderboard renders
+        'role', 'total_points', 'total_predictions', 'correct_predictions', 'exact_predictions',
+        'user__username', 'user__profile__avatar_image'
+    ).order_by('-total_points', '-correct_predictions')
     
     # Get group leagues and flexible selections
     leagues = group.leagues.all().order_by('country__name', 'name')
@@ -838,6 +802,14 @@ def my_groups(request):
         invitee=request.user, status='pending'
     ).select_related('group', 'inviter').order_by('-created_at')
     
+    # Member counts of all listed groups in one query instead of one per group
+    groups = [membership.group for membership in memberships] + [invitation.group for invitation in pending_invitations]
+    member_counts = dict(
+        GroupMembership.objects.filter(group__in=groups).values_list('group').annotate(Count('pk')).order_by()
+    )
+    for group in groups:
+        group.member_count = member_counts.get(group.pk, 0)
+    
     context = {
         'memberships': memberships,
         'pending_invitations': pending_invitations,
@@ -871,14 +843,14 @@ def prediction_center(request):
     
     # Get matches from user's groups using the new flexible system
     if user_groups.exists():
-        # Collect all matches from all user groups
-        all_group_matches = Fixture.objects.none()
+        # Collect all matches from all user groups; OR'ed id subqueries instead of
+        # union(), which cannot be filtered further
+        group_matches_filter = Q()
         for group in user_groups:
-            group_matches = group.get_all_matches()
-            all_group_matches = all_group_matches.union(group_matches)
+            group_matches_filter |= Q(id__in=group.get_all_matches().values('id'))
         
         # Filter for upcoming matches and add season filter
-        matches = all_group_matches.filter(
+        matches = Fixture.objects.filter(group_matches_filter).filter(
             season=selected_season,
             status_long='Not Started',
             date__gte=timezone.now()
@@ -891,21 +863,25 @@ def prediction_center(request):
             date__gte=timezone.now()
         ).select_related('home_team', 'away_team', 'league', 'season').order_by('date')[:20]
     
+    # Evaluate the page of matches once; the prediction lookup reuses their ids
+    matches = list(matches)
+    
     # Get existing predictions for these matches
     existing_predictions = MatchPredict.objects.filter(
         user=request.user,
-        match__in=matches
-    ).select_related('match')
+        match_id__in=[match.id for match in matches]
+    ).only('match_id', 'predicted_result', 'predicted_home_score', 'predicted_away_score')
     
     # Create a dictionary for easy lookup
-    predictions_dict = {pred.match.id: pred for pred in existing_predictions}
+    predictions_dict = {pred.match_id: pred for pred in existing_predictions}
     
     # Add prediction info to matches
+    now = timezone.now()
     for match in matches:
         match.user_prediction = predictions_dict.get(match.id)
         match.can_predict = (
             match.status_long == 'Not Started' and 
-            match.date > timezone.now()
+            match.date > now
         )
     
     context = {
@@ -924,7 +900,7 @@ def make_prediction(request, match_id):
     match = get_object_or_404(Fixture, id=match_id)
     
     # Check if user can make predictions for this match
-    if match.status_long in ['Match Finished', 'In Progress', 'First Half, Kick Off', 'Second Half, 2nd Half Started', 'Extra Time', 'Penalty In Progress']:
+    if match.status_long in Fixture.FINISHED_OR_LIVE_STATUSES:
         messages.error(request, f"Cannot make predictions for {match.get_status_display().lower()} matches.")
         return redirect('prediction_center')
     
@@ -1101,15 +1077,14 @@ def my_predictions(request):
     
     # Calculate statistics
     total_predictions = predictions.count()
-    finished_predictions = predictions.filter(match__status_long='Match Finished')
-    # Calculate correct predictions manually since result is a property
-    correct_predictions = 0
-    for prediction in finished_predictions:
-        if prediction.is_correct:
-            correct_predictions += 1
-    total_points = sum(pred.points_earned for pred in finished_predictions)
+    # Correct results and points for finished matches in one aggregate query
+    finished_stats = predictions.filter(
+        match__status_long='Match Finished'
+    ).aggregate(**MatchPredict.stats_aggregates())
+    correct_predictions = finished_stats['correct']
+    total_points = finished_stats['points'] or 0
     
-    accuracy = (correct_predictions / finished_predictions.count() * 100) if finished_predictions.count() > 0 else 0
+    accuracy = (correct_predictions / finished_stats['total'] * 100) if finished_stats['total'] > 0 else 0
     
     context = {
         'predictions': predictions,
@@ -1194,20 +1169,29 @@ def create_group_view(request):
         if form.is_valid():
             group = form.save(commit=False)
             group.creator = request.user
-            group.save()
-            
-            # The form's save method will handle the flexible match selections
-            form.save()
-            
-            # Add creator as admin member
-            GroupMembership.objects.create(
-                user=request.user,
-                group=group,
-                role='admin'
-            )
-            
-            messages.success(request, f"Group '{group.name}' created successfully!")
-            return redirect('group_detail', group_id=group.id)
+            try:
+                with transaction.atomic():
+                    group.save()
+            except IntegrityError:
+                # Only a name taken between validation and the INSERT is a form error
+                if not UserGroup.objects.filter(name=group.name).exists():
+                    raise
+                unique_error = form.fields['name'].error_messages['unique']
+                form.add_error('name', unique_error)
+                messages.error(request, f"name: {unique_error}")
+            else:
+                # The form's save method will handle the flexible match selections
+                form.save()
+                
+                # Add creator as admin member
+                GroupMembership.objects.create(
+                    user=request.user,
+                    group=group,
+                    role='admin'
+                )
+                
+                messages.success(request, f"Group '{group.name}' created successfully!")
+                return redirect('group_detail', group_id=group.id)
         else:
             # Add error messages to help debug form issues
             for field, errors in form.errors.items():
@@ -1280,7 +1264,8 @@ def send_invitation_view(request, group_id):
         return redirect('group_detail', group_id=group.id)
     
     if request.method == 'POST':
-        form = GroupInvitationForm(request.POST)
+        # The group on the instance lets the form check existing members and invitations
+        form = GroupInvitationForm(request.POST, instance=GroupInvitation(group=group))
         if form.is_valid():
             invitation = form.save(commit=False)
             invitation.group = group
@@ -1378,17 +1363,17 @@ def get_leagues_by_country(request):
         leagues = League.objects.filter(
             country_id__in=country_ids,
             is_active=True
-        ).select_related('country').order_by('country__name', 'name')
+        ).order_by('country__name', 'name').values_list('id', 'name', 'country__name', 'level')
         
         # Format the response
         leagues_data = []
-        for league in leagues:
+        for league_id, name, country_name, level in leagues:
             leagues_data.append({
-                'id': league.id,
-                'name': league.name,
-                'country_name': league.country.name,
-                'level': league.level,
-                'display_name': f"{league.name} ({league.country.name})"
+                'id': league_id,
+                'name': name,
+                'country_name': country_name,
+                'level': level,
+                'display_name': f"{name} ({country_name})"
             })
         
         return JsonResponse({'leagues': leagues_data})